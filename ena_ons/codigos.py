@@ -1,9 +1,10 @@
 """Módulo para códigos que precisam ser hardcoded."""
 
-from pydantic import BaseModel
+from dataclasses import dataclass
 
 
-class Codigos(BaseModel):
+@dataclass(frozen=True, slots=True)
+class Codigos:
     """Códigos necessários para gerar vazões artificiais."""
 
     traicao: int = 104
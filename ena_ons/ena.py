@@ -1,12 +1,49 @@
 """Módulo para transformação de vazão em Energia Natural Afluente."""
 
+import functools
+import hashlib
+import os
+import tempfile
+import threading
+import time
+import zipfile
+
+from collections import OrderedDict
+from collections.abc import Sequence
+from datetime import timedelta
+from pathlib import Path
+
+import numpy as np
+import numpy.typing as npt
 import pandas as pd
 
 from pandas.errors import ParserError
 
+from ena_ons import codigos
 from ena_ons import regras
 
 
+_MAXIMO_VAZOES_MEMORIZADAS = 4
+_FORMATOS_DATA = ("%Y-%m-%d", "%Y-%m-%d %H:%M:%S")
+
+
+@functools.cache
+def _assinatura_regras() -> str:
+    """
+    Calcula o hash do código-fonte das regras de cálculo.
+
+    Returns
+    -------
+    str
+        Hash dos módulos que definem as vazões artificiais.
+    """
+    conteudo = hashlib.sha256()
+    for caminho in (codigos.__file__, regras.__file__, __file__):
+        conteudo.update(Path(str(caminho)).read_bytes())
+
+    return conteudo.hexdigest()
+
+
 class VazaoENA:
     """Classe para transformação vazão -> ENA."""
 
@@ -14,6 +51,9 @@ class VazaoENA:
         self,
         dados: pd.DataFrame,
         produtibilidade: pd.DataFrame,
+        dtype: npt.DTypeLike = np.float64,
+        diretorio_cache: str | os.PathLike[str] | None = None,
+        validade_cache: timedelta | None = None,
     ) -> None:
         """
         Inicialização da classe.
@@ -25,11 +65,95 @@ class VazaoENA:
         produtibilidade : pd.DataFrame:
             Dataframe com colunas "codigo", "produtibilidade" para todos os postos com
             valor de produtibilidade.
-        agrupamentos : pd.DataFrame
-            Agrupamentos desejados para agrupar valores de ENA.
+        dtype : npt.DTypeLike, optional
+            Tipo numérico usado nos cálculos de vazão e ENA, by default np.float64.
+            Usar np.float32 reduz pela metade a memória movimentada, com erro
+            relativo da ordem de 1e-7; as somas de `agrupar` são acumuladas em
+            float64.
+        diretorio_cache : str | os.PathLike[str] | None, optional
+            Diretório onde as vazões artificiais calculadas são persistidas, para
+            reuso entre execuções com os mesmos dados e hidrograma, by default None
+            (sem cache em disco).
+        validade_cache : timedelta | None, optional
+            Idade máxima de um arquivo do cache em disco para que seja reaproveitado,
+            by default None (sem expiração).
+        """
+        self.dtype = np.dtype(dtype)
+        self.diretorio_cache = (
+            None if diretorio_cache is None else Path(diretorio_cache)
+        )
+        if self.diretorio_cache is not None:
+            self.diretorio_cache.mkdir(parents=True, exist_ok=True)
+        self.validade_cache = validade_cache
+        self._trava = threading.Lock()
+        self.dados = dados
+        self.produtibilidade = produtibilidade
+
+    @property
+    def dados(self) -> pd.DataFrame:
+        """
+        Dados de vazão validados.
+
+        Returns
+        -------
+        pd.DataFrame
+            Dataframe com postos como colunas, datas como index e valores sendo vazão.
+        """
+        return self._dados
+
+    @dados.setter
+    def dados(self, dados: pd.DataFrame) -> None:
+        """
+        Valida novos dados de vazão e descarta vazões artificiais já calculadas.
+
+        Parameters
+        ----------
+        dados : pd.DataFrame
+            Dataframe com postos como colunas, datas como index e valores sendo vazão.
+        """
+        dados = self.__validar_dados__(dados)
+        with self._trava:
+            self._dados = dados
+            self._vazoes_artificiais: OrderedDict[
+                tuple, tuple[pd.DataFrame, pd.DataFrame]
+            ] = OrderedDict()
+
+    @property
+    def produtibilidade(self) -> pd.DataFrame:
+        """
+        Produtibilidade validada dos postos.
+
+        Returns
+        -------
+        pd.DataFrame
+            Dataframe com colunas "codigo", "produtibilidade".
+        """
+        return self._produtibilidade
+
+    @produtibilidade.setter
+    def produtibilidade(self, produtibilidade: pd.DataFrame) -> None:
+        """
+        Valida nova produtibilidade e recalcula seu vetor por posto.
+
+        Parameters
+        ----------
+        produtibilidade : pd.DataFrame
+            Dataframe com colunas "codigo", "produtibilidade" para todos os postos com
+            valor de produtibilidade.
         """
-        self.dados = self.__validar_dados__(dados)
-        self.produtibilidade = self.__validar_produtibilidade__(produtibilidade)
+        self._produtibilidade = self.__validar_produtibilidade__(produtibilidade)
+        self._produtibilidade_por_posto = self._produtibilidade.set_index("codigo")[
+            "produtibilidade"
+        ].astype(self.dtype)
+        self._alinhamento_ena: tuple[
+            pd.Index, pd.Series, npt.NDArray[np.intp], pd.Index, np.ndarray
+        ] = (
+            pd.Index([]),
+            self._produtibilidade_por_posto,
+            np.empty(0, dtype=np.intp),
+            pd.Index([], name="codigo"),
+            np.empty(0, dtype=self.dtype),
+        )
 
     def __validar_dados__(self, dados: pd.DataFrame) -> pd.DataFrame:
         """
@@ -51,7 +175,7 @@ class VazaoENA:
             Caso dado passado na construção da classe não possa ser validado por algum
             motivo.
         """
-        if dados.columns.dtype not in [int, float]:
+        if not pd.api.types.is_numeric_dtype(dados.columns):
             try:
                 dados.columns = dados.columns.astype(float)
             except ValueError:
@@ -60,15 +184,62 @@ class VazaoENA:
                     "no tipo int ou float!"
                 )
 
-        if not pd.api.types.is_datetime64_dtype(dados.index):
+        if not pd.api.types.is_datetime64_any_dtype(dados.index):
+            dados.index = self.__converter_datas__(dados.index)
+
+        try:
+            dados = dados.astype(self.dtype)
+        except (ValueError, TypeError):
+            raise ValueError(
+                "Valores do dataframe de dados devem ser numéricos, conversíveis "
+                f"para {self.dtype}!"
+            )
+
+        if len(dados.columns) and not dados.iloc[:, 0].to_numpy().flags.c_contiguous:
+            dados = pd.DataFrame(
+                np.asfortranarray(dados.to_numpy()),
+                index=dados.index,
+                columns=dados.columns,
+                copy=False,
+            )
+
+        return dados
+
+    @staticmethod
+    def __converter_datas__(index: pd.Index) -> pd.DatetimeIndex:
+        """
+        Converte o index de dados para datetime.
+
+        Os formatos publicados pelo ONS são tentados antes da inferência de formato,
+        que é bem mais lenta.
+
+        Parameters
+        ----------
+        index : pd.Index
+            Index do dataframe de dados.
+
+        Returns
+        -------
+        pd.DatetimeIndex
+            Index convertido.
+
+        Raises
+        ------
+        ValueError
+            Caso o index não possa ser convertido.
+        """
+        for formato in _FORMATOS_DATA:
             try:
-                dados.index = pd.to_datetime(dados.index)
+                return pd.to_datetime(index, format=formato, cache=True)
             except (ValueError, ParserError):
-                raise ValueError(
-                    "Index do dataframe deve ser do tipo datetime64 ou parseável!"
-                )
+                continue
 
-        return dados
+        try:
+            return pd.to_datetime(index, cache=True)
+        except (ValueError, ParserError):
+            raise ValueError(
+                "Index do dataframe deve ser do tipo datetime64 ou parseável!"
+            )
 
     def __validar_produtibilidade__(
         self, produtibilidade: pd.DataFrame
@@ -100,9 +271,8 @@ class VazaoENA:
                     f"Dataframe de produtibilidade deve conter coluna '{coluna}'!"
                 )
 
-        produtibilidade["codigo"] = produtibilidade.codigo.astype(float)
-        produtibilidade["produtibilidade"] = produtibilidade.produtibilidade.astype(
-            float
+        produtibilidade = produtibilidade.astype(
+            {"codigo": float, "produtibilidade": float}
         )
         return produtibilidade
 
@@ -131,8 +301,7 @@ class VazaoENA:
                 raise ValueError(
                     f"Dataframe do hidrograma deve conter coluna '{coluna}'!"
                 )
-        hidrograma["mes"] = hidrograma.mes.astype(int)
-        hidrograma["vazao"] = hidrograma.vazao.astype(float)
+        hidrograma = hidrograma.astype({"mes": int, "vazao": float})
         return hidrograma
 
     def __validar_agrupamento__(self, agrupamento: pd.DataFrame) -> pd.DataFrame:
@@ -168,6 +337,392 @@ class VazaoENA:
 
         return agrupamento
 
+    def __arquivo_cache__(
+        self, diretorio: Path, dados: pd.DataFrame, hidrograma: pd.DataFrame
+    ) -> Path:
+        """
+        Define o arquivo de cache em disco das vazões artificiais.
+
+        O nome do arquivo é o hash do conteúdo dos dados e do hidrograma, do tipo
+        numérico e do código-fonte das regras (módulos `ena`, `regras` e `codigos`),
+        para que mudanças nas regras não reaproveitem resultados antigos.
+
+        Parameters
+        ----------
+        diretorio : Path
+            Diretório do cache em disco.
+        dados : pd.DataFrame
+            Dados de vazão usados no cálculo.
+        hidrograma : pd.DataFrame
+            Hidrograma validado.
+
+        Returns
+        -------
+        Path
+            Caminho do arquivo de cache.
+        """
+        conteudo = hashlib.sha256(f"{_assinatura_regras()}|{self.dtype}".encode())
+        for df in (dados, hidrograma):
+            conteudo.update(str(list(df.columns)).encode())
+            conteudo.update(pd.util.hash_pandas_object(df).to_numpy().tobytes())
+
+        return diretorio / f"vazoes_artificiais_{conteudo.hexdigest()}.npz"
+
+    def __ler_cache__(self, arquivo: Path, dados: pd.DataFrame) -> pd.DataFrame | None:
+        """
+        Lê vazões artificiais do cache em disco.
+
+        O arquivo guarda apenas arrays numéricos e é lido sem `pickle`, de modo que
+        um arquivo adulterado no diretório não executa código. Arquivos ilegíveis ou
+        incompatíveis com os dados são ignorados.
+
+        Parameters
+        ----------
+        arquivo : Path
+            Arquivo do cache em disco.
+        dados : pd.DataFrame
+            Dados de vazão usados no cálculo.
+
+        Returns
+        -------
+        pd.DataFrame | None
+            Vazões com as artificiais adicionadas, ou None se o arquivo não puder ser
+            aproveitado.
+        """
+        try:
+            with np.load(arquivo, allow_pickle=False) as conteudo:
+                valores = conteudo["valores"]
+                colunas = conteudo["colunas"]
+        except (OSError, ValueError, KeyError, EOFError, zipfile.BadZipFile):
+            return None
+
+        if valores.shape != (len(colunas), len(dados.index)):
+            return None
+
+        return pd.DataFrame(valores.T, index=dados.index, columns=colunas)
+
+    @staticmethod
+    def __gravar_cache__(arquivo: Path, vazoes: pd.DataFrame) -> None:
+        """
+        Grava vazões artificiais no cache em disco.
+
+        O conteúdo é escrito em um arquivo temporário exclusivo e movido para o
+        destino, para que leitores concorrentes nunca vejam um arquivo incompleto.
+        Falhas de escrita são ignoradas, já que o cache é apenas uma otimização.
+
+        Parameters
+        ----------
+        arquivo : Path
+            Arquivo do cache em disco.
+        vazoes : pd.DataFrame
+            Vazões com as artificiais adicionadas.
+        """
+        temporario = None
+        try:
+            with tempfile.NamedTemporaryFile(
+                dir=arquivo.parent,
+                prefix=f"{arquivo.stem}.",
+                suffix=".tmp",
+                delete=False,
+            ) as saida:
+                temporario = Path(saida.name)
+                np.savez(
+                    saida,
+                    valores=vazoes.to_numpy().T,
+                    colunas=vazoes.columns.to_numpy(),
+                )
+            os.replace(temporario, arquivo)
+        except (OSError, ValueError):
+            if temporario is not None:
+                temporario.unlink(missing_ok=True)
+
+    def __memorizar__(
+        self, chave: tuple, dados: pd.DataFrame, vazoes: pd.DataFrame
+    ) -> pd.DataFrame:
+        """
+        Memoriza vazões artificiais, descartando as usadas há mais tempo.
+
+        Vazões calculadas a partir de `dados` que já foram substituídos não são
+        memorizadas.
+
+        Parameters
+        ----------
+        chave : tuple
+            Pares (mes, vazao) do hidrograma usado no cálculo.
+        dados : pd.DataFrame
+            Dados de vazão usados no cálculo.
+        vazoes : pd.DataFrame
+            Vazões com as artificiais adicionadas.
+
+        Returns
+        -------
+        pd.DataFrame
+            As próprias vazões memorizadas.
+        """
+        with self._trava:
+            if dados is not self._dados:
+                return vazoes
+            self._vazoes_artificiais[chave] = (dados, vazoes)
+            while len(self._vazoes_artificiais) > _MAXIMO_VAZOES_MEMORIZADAS:
+                self._vazoes_artificiais.popitem(last=False)
+
+        return vazoes
+
+    def __cache_valido__(self, arquivo: Path) -> bool:
+        """
+        Verifica se um arquivo do cache em disco pode ser reaproveitado.
+
+        Um arquivo expirado é removido; ele será regravado de forma atômica com o
+        resultado recalculado.
+
+        Parameters
+        ----------
+        arquivo : Path
+            Arquivo do cache em disco.
+
+        Returns
+        -------
+        bool
+            Se o arquivo existe e não expirou.
+        """
+        try:
+            idade = time.time() - arquivo.stat().st_mtime
+        except FileNotFoundError:
+            return False
+
+        if self.validade_cache is None:
+            return True
+
+        if idade <= self.validade_cache.total_seconds():
+            return True
+
+        try:
+            arquivo.unlink(missing_ok=True)
+        except OSError:
+            pass
+
+        return False
+
+    def __remover_expirados__(self, diretorio: Path) -> None:
+        """
+        Remove do cache em disco os arquivos expirados.
+
+        Inclui entradas de outros dados e hidrogramas, que nunca voltariam a ser
+        lidas, e temporários deixados por gravações interrompidas. Arquivos
+        removidos por outro processo no meio da varredura são ignorados.
+
+        Parameters
+        ----------
+        diretorio : Path
+            Diretório do cache em disco.
+        """
+        if self.validade_cache is None:
+            return
+
+        limite = time.time() - self.validade_cache.total_seconds()
+        for arquivo in diretorio.glob("vazoes_artificiais_*"):
+            try:
+                if arquivo.stat().st_mtime < limite:
+                    arquivo.unlink()
+            except OSError:
+                continue
+
+    @staticmethod
+    def __concatenar__(partes: Sequence[pd.DataFrame | pd.Series]) -> pd.DataFrame:
+        """
+        Concatena dataframes e séries de mesmo index lado a lado em um único bloco.
+
+        Todas as partes normalmente compartilham o index de datas dos dados de entrada,
+        o que vale para todas as regras de cálculo; nesse caso o resultado é alocado
+        uma única vez, com cada posto contíguo em memória. Se algum index divergir, as
+        partes são alinhadas com `pd.concat`.
+
+        Parameters
+        ----------
+        partes : Sequence[pd.DataFrame | pd.Series]
+            Dataframes com postos como colunas ou séries nomeadas pelo posto, todos
+            com datas como index.
+
+        Returns
+        -------
+        pd.DataFrame
+            Dataframe com as colunas de todas as partes, na ordem recebida.
+        """
+        quadros = [
+            parte.to_frame() if isinstance(parte, pd.Series) else parte
+            for parte in partes
+        ]
+        index = quadros[0].index
+        if not all(quadro.index.equals(index) for quadro in quadros[1:]):
+            return pd.concat(quadros, axis=1)
+
+        colunas = quadros[0].columns.append([quadro.columns for quadro in quadros[1:]])
+        valores = np.concatenate([quadro.to_numpy().T for quadro in quadros], axis=0)
+
+        return pd.DataFrame(valores.T, index=index, columns=colunas)
+
+    @staticmethod
+    def __series_alto_tiete__(df: pd.DataFrame) -> list[pd.Series]:
+        """
+        Aplica as regras de cálculo da bacia do Alto Tietê.
+
+        Parameters
+        ----------
+        df : pd.DataFrame
+            Dados coletados do ACOMPH.
+
+        Returns
+        -------
+        list[pd.Series]
+            Uma série por posto artificial, nomeada pelo código do posto.
+        """
+        return [
+            regras.calcular_regra(regras.Traicao, df),
+            regras.calcular_regra(regras.Pedreira, df),
+            regras.calcular_regra(regras.BillingsPedras, df),
+            regras.calcular_regra(regras.Pedras, df),
+            regras.calcular_regra(regras.EdgardSouza, df),
+            regras.calcular_regra(regras.HenryBorden, df),
+            regras.calcular_regra(regras.BillingsArtificial, df),
+            regras.calcular_regra(regras.BarraBonitaArtificial, df),
+            regras.calcular_regra(regras.BaririArtificial, df),
+            regras.calcular_regra(regras.IbitingaArtificial, df),
+            regras.calcular_regra(regras.PromissaoArtificial, df),
+            regras.calcular_regra(regras.NovaAvanhandavaArtificial, df),
+            regras.calcular_regra(regras.TresIrmaosArtificial, df),
+            regras.calcular_regra(regras.IlhaSolteiraEquivalente, df),
+            regras.calcular_regra(regras.JupiaArtificial, df),
+            regras.calcular_regra(regras.PortoPrimaveraArtificial, df),
+            regras.calcular_regra(regras.ItaipuArtificial, df),
+        ]
+
+    @staticmethod
+    def __series_paraiba_sul__(df: pd.DataFrame) -> list[pd.Series]:
+        """
+        Aplica as regras de cálculo da bacia do Paraíba do Sul.
+
+        Parameters
+        ----------
+        df : pd.DataFrame
+            Dados coletados do ACOMPH.
+
+        Returns
+        -------
+        list[pd.Series]
+            Uma série por posto artificial, nomeada pelo código do posto.
+        """
+        return [
+            regras.calcular_regra(regras.BombeamentoSantaCecilia, df),
+            regras.calcular_regra(regras.VertimentoTocos, df),
+            regras.calcular_regra(regras.SantanaNatural, df),
+            regras.calcular_regra(regras.SantanaArtificial, df),
+            regras.calcular_regra(regras.VigarioArtificial, df),
+            regras.calcular_regra(regras.VertimentoSantana, df),
+            regras.calcular_regra(regras.AntaArtificial, df),
+            regras.calcular_regra(regras.SimplicioArtificial, df),
+            regras.calcular_regra(regras.IlhaPombosArtificial, df),
+            regras.calcular_regra(regras.NiloPecanhaArtificial, df),
+            regras.calcular_regra(regras.LajesArtificial, df),
+            regras.calcular_regra(regras.FontesArtificial, df),
+            regras.calcular_regra(regras.PereiraPassosArtificial, df),
+        ]
+
+    @staticmethod
+    def __series_sao_francisco__(df: pd.DataFrame) -> list[pd.Series]:
+        """
+        Aplica as regras de cálculo da bacia do São Francisco.
+
+        Parameters
+        ----------
+        df : pd.DataFrame
+            Dados coletados do ACOMPH.
+
+        Returns
+        -------
+        list[pd.Series]
+            Uma série por posto, nomeada pelo código do posto.
+        """
+        return [
+            regras.calcular_regra(regras.PauloAfonsoNatural, df),
+            regras.calcular_regra(regras.ComplexoNatural, df),
+        ]
+
+    @staticmethod
+    def __series_iguacu__(df: pd.DataFrame) -> list[pd.Series]:
+        """
+        Aplica as regras de cálculo da bacia do Iguaçu.
+
+        Parameters
+        ----------
+        df : pd.DataFrame
+            Dados coletados do ACOMPH.
+
+        Returns
+        -------
+        list[pd.Series]
+            Uma série por posto artificial, nomeada pelo código do posto.
+        """
+        return [
+            regras.calcular_regra(regras.JordaoArtificial, df),
+            regras.calcular_regra(regras.SegredoArtificial, df),
+        ]
+
+    @staticmethod
+    def __series_grande__(df: pd.DataFrame) -> list[pd.Series]:
+        """
+        Aplica as regras de cálculo da bacia do Grande.
+
+        Parameters
+        ----------
+        df : pd.DataFrame
+            Dados coletados do ACOMPH.
+
+        Returns
+        -------
+        list[pd.Series]
+            Uma série por posto, nomeada pelo código do posto.
+        """
+        return [regras.calcular_regra(regras.ItutingaNatural, df)]
+
+    @staticmethod
+    def __series_paraguai__(df: pd.DataFrame) -> list[pd.Series]:
+        """
+        Aplica as regras de cálculo da bacia do Paraguai.
+
+        Parameters
+        ----------
+        df : pd.DataFrame
+            Dados coletados do ACOMPH.
+
+        Returns
+        -------
+        list[pd.Series]
+            Uma série por posto, nomeada pelo código do posto.
+        """
+        return [regras.calcular_regra(regras.ItiquiraII, df)]
+
+    @staticmethod
+    def __series_xingu__(df: pd.DataFrame, hidrograma: pd.DataFrame) -> list[pd.Series]:
+        """
+        Aplica as regras de cálculo da bacia do Xingu.
+
+        Parameters
+        ----------
+        df : pd.DataFrame
+            Dados coletados do ACOMPH.
+        hidrograma : pd.DataFrame
+            Vazões do hidrograma (médio) de Belo Monte por mês.
+
+        Returns
+        -------
+        list[pd.Series]
+            Uma série por posto artificial, nomeada pelo código do posto.
+        """
+        return [
+            regras.calcular_regra(regras.BeloMonteArtificial, df, hidrograma),
+            regras.calcular_regra(regras.PimentalArtificial, df, hidrograma),
+        ]
+
     @staticmethod
     def calcular_artificiais_alto_tiete(df: pd.DataFrame) -> pd.DataFrame:
         """
@@ -186,48 +741,8 @@ class VazaoENA:
         pd.DataFrame
             Vazões Artificiais do Alto Tietê.
         """
-        traicao = regras.Traicao(df).calcular()
-        pedreira = regras.Pedreira(df).calcular()
-        billings_pedras = regras.BillingsPedras(df).calcular()
-        pedras = regras.Pedras(df).calcular()
-        edgard_souza = regras.EdgardSouza(df).calcular()
-        henry_borden = regras.HenryBorden(df).calcular()
-        billings_artificial = regras.BillingsArtificial(df).calcular()
-        bbonita = regras.BarraBonitaArtificial(df).calcular()
-        bariri_art = regras.BaririArtificial(df).calcular()
-        ibitinga_art = regras.IbitingaArtificial(df).calcular()
-        promissao_art = regras.PromissaoArtificial(df).calcular()
-        navanhandava_art = regras.NovaAvanhandavaArtificial(df).calcular()
-        tres_irmaos_art = regras.TresIrmaosArtificial(df).calcular()
-        ilha_solteira = regras.IlhaSolteiraEquivalente(df).calcular()
-        jupia_art = regras.JupiaArtificial(df).calcular()
-        pprimavera_art = regras.PortoPrimaveraArtificial(df).calcular()
-        itaipu_art = regras.ItaipuArtificial(df).calcular()
-
-        df_alto_tiete = pd.concat(
-            [
-                traicao,
-                pedreira,
-                billings_pedras,
-                pedras,
-                edgard_souza,
-                henry_borden,
-                billings_artificial,
-                bbonita,
-                bariri_art,
-                ibitinga_art,
-                promissao_art,
-                navanhandava_art,
-                tres_irmaos_art,
-                ilha_solteira,
-                jupia_art,
-                pprimavera_art,
-                itaipu_art,
-            ],
-            axis=1,
-        )
-
-        return df_alto_tiete
+        with regras.memorizar_intermediarios(df):
+            return VazaoENA.__concatenar__(VazaoENA.__series_alto_tiete__(df))
 
     @staticmethod
     def calcular_artificiais_paraiba_sul(df: pd.DataFrame) -> pd.DataFrame:
@@ -247,40 +762,8 @@ class VazaoENA:
         pd.DataFrame
             Vazões Artificiais do Paraíba do Sul.
         """
-        bombeamento_sta_cecilia = regras.BombeamentoSantaCecilia(df).calcular()
-        vertimento_tocos = regras.VertimentoTocos(df).calcular()
-        santana_natural = regras.SantanaNatural(df).calcular()
-        santana_art = regras.SantanaArtificial(df).calcular()
-        vigario_art = regras.VigarioArtificial(df).calcular()
-        vertimento_santana = regras.VertimentoSantana(df).calcular()
-        anta_art = regras.AntaArtificial(df).calcular()
-        simplicio_art = regras.SimplicioArtificial(df).calcular()
-        ilha_pombos_art = regras.IlhaPombosArtificial(df).calcular()
-        nilo_pecanha_art = regras.NiloPecanhaArtificial(df).calcular()
-        lajes_art = regras.LajesArtificial(df).calcular()
-        fontes_art = regras.FontesArtificial(df).calcular()
-        pereira_passos_art = regras.PereiraPassosArtificial(df).calcular()
-
-        df_paraiba_sul = pd.concat(
-            [
-                bombeamento_sta_cecilia,
-                vertimento_tocos,
-                santana_natural,
-                santana_art,
-                vigario_art,
-                vertimento_santana,
-                anta_art,
-                simplicio_art,
-                ilha_pombos_art,
-                nilo_pecanha_art,
-                lajes_art,
-                fontes_art,
-                pereira_passos_art,
-            ],
-            axis=1,
-        )
-
-        return df_paraiba_sul
+        with regras.memorizar_intermediarios(df):
+            return VazaoENA.__concatenar__(VazaoENA.__series_paraiba_sul__(df))
 
     @staticmethod
     def calcular_naturais_sao_francisco(df: pd.DataFrame) -> pd.DataFrame:
@@ -300,12 +783,8 @@ class VazaoENA:
         pd.DataFrame
             Vazões Naturais do São Francisco.
         """
-        pafonso = regras.PauloAfonsoNatural(df).calcular()
-        complexo = regras.ComplexoNatural(df).calcular()
-
-        df_sf = pd.concat([pafonso, complexo], axis=1)
-
-        return df_sf
+        with regras.memorizar_intermediarios(df):
+            return VazaoENA.__concatenar__(VazaoENA.__series_sao_francisco__(df))
 
     @staticmethod
     def calcular_artificiais_iguacu(df: pd.DataFrame) -> pd.DataFrame:
@@ -325,12 +804,8 @@ class VazaoENA:
         pd.DataFrame
             Vazões Artificiais do Iguaçu.
         """
-        jordao = regras.JordaoArtificial(df).calcular()
-        segredo = regras.SegredoArtificial(df).calcular()
-
-        df_iguacu = pd.concat([jordao, segredo], axis=1)
-
-        return df_iguacu
+        with regras.memorizar_intermediarios(df):
+            return VazaoENA.__concatenar__(VazaoENA.__series_iguacu__(df))
 
     @staticmethod
     def calcular_naturais_grande(df: pd.DataFrame) -> pd.DataFrame:
@@ -350,9 +825,8 @@ class VazaoENA:
         pd.DataFrame
             Vazões Naturais do Grande.
         """
-        regra = regras.ItutingaNatural(df).calcular()
-        df = regra.to_frame()
-        return df
+        with regras.memorizar_intermediarios(df):
+            return VazaoENA.__concatenar__(VazaoENA.__series_grande__(df))
 
     @staticmethod
     def calcular_naturais_paraguai(df: pd.DataFrame) -> pd.DataFrame:
@@ -372,9 +846,8 @@ class VazaoENA:
         pd.DataFrame
             Vazões Naturais do Paraguai.
         """
-        regra = regras.ItiquiraII(df).calcular()
-        df = regra.to_frame()
-        return df
+        with regras.memorizar_intermediarios(df):
+            return VazaoENA.__concatenar__(VazaoENA.__series_paraguai__(df))
 
     @staticmethod
     def calcular_artificiais_xingu(
@@ -398,17 +871,18 @@ class VazaoENA:
         pd.DataFrame
             Vazões Artificiais do Xingu.
         """
-        belomonte = regras.BeloMonteArtificial(df, hidrograma).calcular()
-        pimental_art = regras.PimentalArtificial(df, hidrograma).calcular()
-
-        df_xingu = pd.concat([belomonte, pimental_art], axis=1)
-
-        return df_xingu
+        with regras.memorizar_intermediarios(df):
+            return VazaoENA.__concatenar__(VazaoENA.__series_xingu__(df, hidrograma))
 
     def adicionar_vazoes_artificiais(self, hidrograma: pd.DataFrame) -> pd.DataFrame:
         """
         Adiciona vazões artificiais aos dados de vazão da entrada.
 
+        O resultado é memorizado por hidrograma (até os 4 usados mais recentemente) e
+        descartado quando `dados` é reatribuído. Alterações feitas diretamente no
+        dataframe de `dados` não são detectadas. Se `diretorio_cache` foi informado, o
+        resultado também é lido e gravado em disco.
+
         Parameters
         ----------
         hidrograma : pd.DataFrame
@@ -422,29 +896,42 @@ class VazaoENA:
             Dataframe com vazão natural afluente diária por posto.
         """
         hidrograma = self.__validar_hidrograma__(hidrograma)
-
-        df = self.dados.copy()
-        df_alto_tiete = self.calcular_artificiais_alto_tiete(df)
-        df_paraiba_sul = self.calcular_artificiais_paraiba_sul(df)
-        df_sf = self.calcular_naturais_sao_francisco(df)
-        df_iguacu = self.calcular_artificiais_iguacu(df)
-        df_grande = self.calcular_naturais_grande(df)
-        df_paraguai = self.calcular_naturais_paraguai(df)
-        df_xingu = self.calcular_artificiais_xingu(df, hidrograma)
-
-        return pd.concat(
-            [
-                df,
-                df_alto_tiete,
-                df_paraiba_sul,
-                df_sf,
-                df_iguacu,
-                df_grande,
-                df_paraguai,
-                df_xingu,
-            ],
-            axis=1,
-        )
+        chave = tuple(hidrograma[["mes", "vazao"]].itertuples(index=False, name=None))
+        with self._trava:
+            df = self._dados
+            memorizadas = self._vazoes_artificiais.get(chave)
+            if memorizadas is not None and memorizadas[0] is df:
+                self._vazoes_artificiais.move_to_end(chave)
+                return memorizadas[1].copy()
+
+        arquivo = None
+        if self.diretorio_cache is not None:
+            arquivo = self.__arquivo_cache__(self.diretorio_cache, df, hidrograma)
+            vazoes = (
+                self.__ler_cache__(arquivo, df)
+                if self.__cache_valido__(arquivo)
+                else None
+            )
+            if vazoes is not None:
+                return self.__memorizar__(chave, df, vazoes).copy()
+
+        with regras.memorizar_intermediarios(df):
+            series = [
+                *self.__series_alto_tiete__(df),
+                *self.__series_paraiba_sul__(df),
+                *self.__series_sao_francisco__(df),
+                *self.__series_iguacu__(df),
+                *self.__series_grande__(df),
+                *self.__series_paraguai__(df),
+                *self.__series_xingu__(df, hidrograma),
+            ]
+
+        vazoes = self.__memorizar__(chave, df, self.__concatenar__([df, *series]))
+        if arquivo is not None:
+            self.__gravar_cache__(arquivo, vazoes)
+            self.__remover_expirados__(arquivo.parent)
+
+        return vazoes.copy()
 
     def calcular_ena(self, df: pd.DataFrame) -> pd.DataFrame:
         """
@@ -458,17 +945,31 @@ class VazaoENA:
         Returns
         -------
         pd.DataFrame
-            Dataframe com valores de ENA.
+            Dataframe com valores de ENA, com os postos ordenados como colunas
+            (nomeadas "codigo").
         """
-        df_melt = df.melt(
-            value_name="valor", var_name="codigo", ignore_index=False
-        ).reset_index()
-        df_prod = df_melt.merge(self.produtibilidade, on="codigo", how="left")
-        df_prod = df_prod.assign(ena=df_prod.valor * df_prod.produtibilidade)
+        # O alinhamento é lido e substituído como uma única tupla, para que
+        # chamadas concorrentes nunca combinem ordem e vetor de colunas diferentes.
+        produtibilidade = self._produtibilidade_por_posto
+        colunas, origem, ordem, colunas_ordenadas, vetor = self._alinhamento_ena
+        if origem is not produtibilidade or not df.columns.equals(colunas):
+            ordem = np.argsort(df.columns.to_numpy(), kind="stable")
+            colunas_ordenadas = df.columns[ordem].rename("codigo")
+            vetor = produtibilidade.reindex(colunas_ordenadas).to_numpy()
+            self._alinhamento_ena = (
+                df.columns,
+                produtibilidade,
+                ordem,
+                colunas_ordenadas,
+                vetor,
+            )
 
-        df_ena = df_prod[["data", "codigo", "ena"]].pivot(
-            index="data", columns="codigo", values="ena"
+        df_ena = pd.DataFrame(
+            df.to_numpy()[:, ordem] * vetor,
+            index=df.index,
+            columns=colunas_ordenadas,
         )
+
         return df_ena
 
     def agrupar(self, df: pd.DataFrame, agrupamento: pd.DataFrame) -> pd.DataFrame:
@@ -489,17 +990,17 @@ class VazaoENA:
             ENA somada por agrupamento.
         """
         agrupamento = self.__validar_agrupamento__(agrupamento)
-        for coluna in agrupamento.columns:
-            if coluna != "codigo":
-                grupo = coluna
+        grupo = agrupamento.columns.drop("codigo")[0]
 
-        df_melt = df.melt(
-            value_name="valor", var_name="codigo", ignore_index=False
-        ).reset_index()
-        df_relacao = df_melt.merge(agrupamento, on="codigo", how="left")
+        postos = agrupamento.codigo.astype(float)
+        presentes = postos.isin(df.columns)
+        relacao = pd.crosstab(postos[presentes], agrupamento.loc[presentes, grupo])
 
-        df_agrupado = df_relacao[["data", grupo, "valor"]]
-        df_agrupado = df_agrupado.groupby(["data", grupo]).sum().reset_index()
-        df_pivotado = df_agrupado.pivot(index="data", columns=grupo, values="valor")
+        ena = np.nan_to_num(df[relacao.index].to_numpy())
+        df_agrupado = pd.DataFrame(
+            ena @ relacao.to_numpy(dtype=float),
+            index=df.index,
+            columns=relacao.columns,
+        )
 
-        return df_pivotado
+        return df_agrupado
@@ -1,10 +1,100 @@
 """Módulo para tratar regras específicas para cáculo de ENA."""
 
+import functools
+import operator
+import threading
+
+from collections import Counter
+from collections.abc import Callable
+from collections.abc import Iterator
+from contextlib import contextmanager
+from typing import Any
+from typing import Protocol
+
+import numpy as np
 import pandas as pd
 
 from ena_ons.codigos import codigos
 
 
+class Regra(Protocol):
+    """Regra de cálculo de vazão de um posto."""
+
+    def calcular(self) -> pd.Series:
+        """Aplica a regra de cálculo."""
+        ...
+
+
+_intermediarios: dict[tuple[Any, ...], tuple[tuple[pd.DataFrame, ...], pd.Series]] = {}
+_quadros_memorizados: Counter[int] = Counter()
+_trava = threading.Lock()
+
+
+@contextmanager
+def memorizar_intermediarios(df: pd.DataFrame) -> Iterator[None]:
+    """
+    Memoriza as regras calculadas sobre `df` enquanto o contexto estiver aberto.
+
+    Várias regras dependem das mesmas regras intermediárias (Santana Natural,
+    Bombeamento de Santa Cecília, Vigário Artificial, ...). Dentro do contexto, cada
+    uma é calculada uma única vez para `df` por `calcular_regra`; ao sair, as séries
+    memorizadas são descartadas. `df` não deve ser alterado dentro do contexto.
+
+    Parameters
+    ----------
+    df : pd.DataFrame
+        Dataframe com série diária de valores de vazão.
+    """
+    with _trava:
+        _quadros_memorizados[id(df)] += 1
+    try:
+        yield
+    finally:
+        with _trava:
+            _quadros_memorizados[id(df)] -= 1
+            if not _quadros_memorizados[id(df)]:
+                del _quadros_memorizados[id(df)]
+                for chave in [chave for chave in _intermediarios if chave[0] == id(df)]:
+                    del _intermediarios[chave]
+
+
+def calcular_regra(
+    regra: Callable[..., Regra], df: pd.DataFrame, *entradas: pd.DataFrame
+) -> pd.Series:
+    """
+    Calcula uma regra sobre `df`, reaproveitando o resultado já memorizado.
+
+    Fora de `memorizar_intermediarios` a regra é sempre calculada.
+
+    Parameters
+    ----------
+    regra : Callable[..., Regra]
+        Classe da regra de cálculo.
+    df : pd.DataFrame
+        Dataframe com série diária de valores de vazão.
+    *entradas : pd.DataFrame
+        Demais dataframes exigidos pela regra, como o hidrograma de Belo Monte. São
+        mantidos junto ao resultado memorizado, para que sua identidade continue
+        válida como chave.
+
+    Returns
+    -------
+    pd.Series
+        Valores de vazão com regra de cálculo.
+    """
+    chave = (id(df), regra, *map(id, entradas))
+    memorizado = _intermediarios.get(chave)
+    if memorizado is not None:
+        return memorizado[1]
+
+    vazao = regra(df, *entradas).calcular()
+    with _trava:
+        if id(df) in _quadros_memorizados:
+            _intermediarios[chave] = (entradas, vazao)
+
+    return vazao
+
+
 class Traicao:
     """Regra de cálculo de usina artificial."""
 
@@ -29,8 +119,11 @@ class Traicao:
         pd.Series
             Valores de vazão com regra de cálculo.
         """
-        vazao = self.guarapiranga + self.billings
-        vazao.name = codigos.traicao
+        vazao = pd.Series(
+            self.guarapiranga.to_numpy() + self.billings.to_numpy(),
+            index=self.guarapiranga.index,
+            name=codigos.traicao,
+        )
 
         return vazao
 
@@ -58,8 +151,11 @@ class Pedreira:
         pd.Series
             Valores de vazão com regra de cálculo.
         """
-        vazao = self.billings
-        vazao.name = codigos.pedreira
+        vazao = pd.Series(
+            self.billings.to_numpy(copy=True),
+            index=self.billings.index,
+            name=codigos.pedreira,
+        )
 
         return vazao
 
@@ -87,8 +183,11 @@ class BillingsPedras:
         pd.Series
             Valores de vazão com regra de cálculo.
         """
-        vazao = (self.billings - 0.185) / 0.8103
-        vazao.name = codigos.billings_pedras
+        vazao = pd.Series(
+            (self.billings.to_numpy() - 0.185) / 0.8103,
+            index=self.billings.index,
+            name=codigos.billings_pedras,
+        )
 
         return vazao
 
@@ -106,7 +205,7 @@ class Pedras:
             Dataframe com série diária de valores de vazão.
         """
         self.billings = df[codigos.billings]
-        self.billings_pedras = BillingsPedras(df).calcular()
+        self.billings_pedras = calcular_regra(BillingsPedras, df)
 
     def calcular(self) -> pd.Series:
         """
@@ -117,8 +216,11 @@ class Pedras:
         pd.Series
             Valores de vazão com regra de cálculo.
         """
-        vazao = self.billings_pedras - self.billings
-        vazao.name = codigos.pedras
+        vazao = pd.Series(
+            self.billings_pedras.to_numpy() - self.billings.to_numpy(),
+            index=self.billings.index,
+            name=codigos.pedras,
+        )
 
         return vazao
 
@@ -148,8 +250,13 @@ class EdgardSouza:
         pd.Series
             Valores de vazão com regra de cálculo.
         """
-        vazao = self.esouza - self.guarapiranga - self.billings
-        vazao.name = codigos.edgard_souza_sem_tributarios
+        vazao = pd.Series(
+            self.esouza.to_numpy()
+            - self.guarapiranga.to_numpy()
+            - self.billings.to_numpy(),
+            index=self.esouza.index,
+            name=codigos.edgard_souza_sem_tributarios,
+        )
 
         return vazao
 
@@ -166,10 +273,11 @@ class HenryBorden:
         df : pd.DataFrame
             Dataframe com série diária de valores de vazão.
         """
-        self.pedras = Pedras(df).calcular()
+        self.pedras = calcular_regra(Pedras, df)
         self.esouza = df[codigos.edgard_souza_com_tributarios]
         self.guarapiranga = df[codigos.guarapiranga]
         self.billings = df[codigos.billings]
+        self.billings_artificial = calcular_regra(BillingsArtificial, df)
 
     def calcular(self) -> pd.Series:
         """
@@ -180,13 +288,11 @@ class HenryBorden:
         pd.Series
             Valores de vazão com regra de cálculo.
         """
-        vazao = (
-            self.pedras
-            + 0.1 * (self.esouza - self.guarapiranga - self.billings)
-            + self.guarapiranga
-            + self.billings
+        vazao = pd.Series(
+            self.pedras.to_numpy() + self.billings_artificial.to_numpy(),
+            index=self.pedras.index,
+            name=codigos.henry_borden,
         )
-        vazao.name = codigos.henry_borden
 
         return vazao
 
@@ -204,6 +310,7 @@ class BillingsArtificial:
             Dataframe com série diária de valores de vazão.
         """
         self.esouza = df[codigos.edgard_souza_com_tributarios]
+        self.edgard_souza = calcular_regra(EdgardSouza, df)
         self.guarapiranga = df[codigos.guarapiranga]
         self.billings = df[codigos.billings]
 
@@ -216,385 +323,155 @@ class BillingsArtificial:
         pd.Series
             Valores de vazão com regra de cálculo.
         """
-        vazao = (
-            0.1 * (self.esouza - self.guarapiranga - self.billings)
-            + self.guarapiranga
-            + self.billings
+        vazao = pd.Series(
+            0.1 * self.edgard_souza.to_numpy()
+            + self.guarapiranga.to_numpy()
+            + self.billings.to_numpy(),
+            index=self.edgard_souza.index,
+            name=codigos.billings_artificial,
         )
-        vazao.name = codigos.billings_artificial
 
         return vazao
 
 
-class BarraBonitaArtificial:
-    """Regra de cálculo de usina artificial."""
-
-    def __init__(self, df: pd.DataFrame) -> None:
-        """
-        Regra de Cálculo para Barra Bonita Artificial.
-
-        Parameters
-        ----------
-        df : pd.DataFrame
-            Dataframe com série diária de valores de vazão.
-        """
-        self.barra_bonita = df[codigos.barra_bonita]
-        self.esouza = df[codigos.edgard_souza_com_tributarios]
-        self.guarapiranga = df[codigos.guarapiranga]
-        self.billings = df[codigos.billings]
+class _TieteArtificial:
+    """Regra de cálculo comum às usinas artificiais do Tietê e do Paraná."""
 
-    def calcular(self) -> pd.Series:
-        """
-        Aplica regra de cálculo de Barra Bonita Artificial.
-
-        Returns
-        -------
-        pd.Series
-            Valores de vazão com regra de cálculo.
-        """
-        vazao = (
-            self.barra_bonita
-            - 0.1 * (self.esouza - self.guarapiranga - self.billings)
-            - self.guarapiranga
-            - self.billings
-        )
-        vazao.name = codigos.barra_bonita_artificial
-
-        return vazao
-
-
-class BaririArtificial:
-    """Regra de cálculo de usina artificial."""
+    naturais: tuple[str, ...]
+    codigo: int
 
     def __init__(self, df: pd.DataFrame) -> None:
         """
-        Regra de Cálculo para Bariri Artificial.
-
-        Parameters
-        ----------
-        df : pd.DataFrame
-            Dataframe com série diária de valores de vazão.
-        """
-        self.bariri = df[codigos.bariri]
-        self.esouza = df[codigos.edgard_souza_com_tributarios]
-        self.guarapiranga = df[codigos.guarapiranga]
-        self.billings = df[codigos.billings]
-
-    def calcular(self) -> pd.Series:
-        """
-        Aplica regra de cálculo de Bariri Artificial.
-
-        Returns
-        -------
-        pd.Series
-            Valores de vazão com regra de cálculo.
-        """
-        vazao = (
-            self.bariri
-            - 0.1 * (self.esouza - self.guarapiranga - self.billings)
-            - self.guarapiranga
-            - self.billings
-        )
-        vazao.name = codigos.bariri_artificial
-
-        return vazao
-
-
-class IbitingaArtificial:
-    """Regra de cálculo de usina artificial."""
+        Regra de cálculo das usinas a jusante de Billings.
 
-    def __init__(self, df: pd.DataFrame) -> None:
-        """
-        Regra de Cálculo para Ibitinga Artificial.
+        A vazão artificial é a soma das vazões naturais da usina menos a vazão de
+        Billings Artificial. Cada subclasse informa os nomes (em `codigos`) dos
+        postos naturais somados em `naturais`, que também nomeiam os atributos com
+        suas séries, e o código do posto artificial em `codigo`.
 
         Parameters
         ----------
         df : pd.DataFrame
             Dataframe com série diária de valores de vazão.
         """
-        self.ibitinga = df[codigos.ibitinga]
+        for posto in self.naturais:
+            setattr(self, posto, df[getattr(codigos, posto)])
         self.esouza = df[codigos.edgard_souza_com_tributarios]
         self.guarapiranga = df[codigos.guarapiranga]
         self.billings = df[codigos.billings]
+        self.billings_artificial = calcular_regra(BillingsArtificial, df)
 
     def calcular(self) -> pd.Series:
         """
-        Aplica regra de cálculo de Ibitinga Artificial.
+        Aplica regra de cálculo da usina artificial.
 
         Returns
         -------
         pd.Series
             Valores de vazão com regra de cálculo.
         """
-        vazao = (
-            self.ibitinga
-            - 0.1 * (self.esouza - self.guarapiranga - self.billings)
-            - self.guarapiranga
-            - self.billings
+        natural = functools.reduce(
+            operator.add,
+            [getattr(self, posto).to_numpy() for posto in self.naturais],
         )
-        vazao.name = codigos.ibitinga_artificial
-
-        return vazao
-
-
-class PromissaoArtificial:
-    """Regra de cálculo de usina artificial."""
-
-    def __init__(self, df: pd.DataFrame) -> None:
-        """
-        Regra de Cálculo para Promissão Artificial.
-
-        Parameters
-        ----------
-        df : pd.DataFrame
-            Dataframe com série diária de valores de vazão.
-        """
-        self.promissao = df[codigos.promissao]
-        self.esouza = df[codigos.edgard_souza_com_tributarios]
-        self.guarapiranga = df[codigos.guarapiranga]
-        self.billings = df[codigos.billings]
-
-    def calcular(self) -> pd.Series:
-        """
-        Aplica regra de cálculo de Promissão Artificial.
-
-        Returns
-        -------
-        pd.Series
-            Valores de vazão com regra de cálculo.
-        """
-        vazao = (
-            self.promissao
-            - 0.1 * (self.esouza - self.guarapiranga - self.billings)
-            - self.guarapiranga
-            - self.billings
+        vazao = pd.Series(
+            natural - self.billings_artificial.to_numpy(),
+            index=self.billings_artificial.index,
+            name=self.codigo,
         )
-        vazao.name = codigos.promissao_artificial
 
         return vazao
 
 
-class NovaAvanhandavaArtificial:
-    """Regra de cálculo de usina artificial."""
+class BarraBonitaArtificial(_TieteArtificial):
+    """Regra de cálculo para Barra Bonita Artificial."""
 
-    def __init__(self, df: pd.DataFrame) -> None:
-        """
-        Regra de Cálculo para Nova Avanhandava Artificial.
+    barra_bonita: pd.Series
 
-        Parameters
-        ----------
-        df : pd.DataFrame
-            Dataframe com série diária de valores de vazão.
-        """
-        self.nova_avanhandava = df[codigos.nova_avanhandava]
-        self.esouza = df[codigos.edgard_souza_com_tributarios]
-        self.guarapiranga = df[codigos.guarapiranga]
-        self.billings = df[codigos.billings]
+    naturais = ("barra_bonita",)
+    codigo = codigos.barra_bonita_artificial
 
-    def calcular(self) -> pd.Series:
-        """
-        Aplica regra de cálculo de Nova Avanhandava Artificial.
 
-        Returns
-        -------
-        pd.Series
-            Valores de vazão com regra de cálculo.
-        """
-        vazao = (
-            self.nova_avanhandava
-            - 0.1 * (self.esouza - self.guarapiranga - self.billings)
-            - self.guarapiranga
-            - self.billings
-        )
-        vazao.name = codigos.nova_avanhandava_artificial
+class BaririArtificial(_TieteArtificial):
+    """Regra de cálculo para Bariri Artificial."""
 
-        return vazao
+    bariri: pd.Series
 
+    naturais = ("bariri",)
+    codigo = codigos.bariri_artificial
 
-class TresIrmaosArtificial:
-    """Regra de cálculo de usina artificial."""
 
-    def __init__(self, df: pd.DataFrame) -> None:
-        """
-        Regra de Cálculo para Três Irmãos Artificial.
+class IbitingaArtificial(_TieteArtificial):
+    """Regra de cálculo para Ibitinga Artificial."""
 
-        Parameters
-        ----------
-        df : pd.DataFrame
-            Dataframe com série diária de valores de vazão.
-        """
-        self.tres_irmaos = df[codigos.tres_irmaos]
-        self.esouza = df[codigos.edgard_souza_com_tributarios]
-        self.guarapiranga = df[codigos.guarapiranga]
-        self.billings = df[codigos.billings]
+    ibitinga: pd.Series
 
-    def calcular(self) -> pd.Series:
-        """
-        Aplica regra de cálculo de Três Irmãos Artificial.
+    naturais = ("ibitinga",)
+    codigo = codigos.ibitinga_artificial
 
-        Returns
-        -------
-        pd.Series
-            Valores de vazão com regra de cálculo.
-        """
-        vazao = (
-            self.tres_irmaos
-            - 0.1 * (self.esouza - self.guarapiranga - self.billings)
-            - self.guarapiranga
-            - self.billings
-        )
-        vazao.name = codigos.tres_irmaos_artificial
 
-        return vazao
+class PromissaoArtificial(_TieteArtificial):
+    """Regra de cálculo para Promissão Artificial."""
 
+    promissao: pd.Series
 
-class IlhaSolteiraEquivalente:
-    """Regra de cálculo de usina artificial."""
+    naturais = ("promissao",)
+    codigo = codigos.promissao_artificial
 
-    def __init__(self, df: pd.DataFrame) -> None:
-        """
-        Regra de Cálculo para Ilha Solteira Artificial.
 
-        Parameters
-        ----------
-        df : pd.DataFrame
-            Dataframe com série diária de valores de vazão.
-        """
-        self.tres_irmaos = df[codigos.tres_irmaos]
-        self.ilha_solteira = df[codigos.ilha_solteira]
-        self.esouza = df[codigos.edgard_souza_com_tributarios]
-        self.guarapiranga = df[codigos.guarapiranga]
-        self.billings = df[codigos.billings]
+class NovaAvanhandavaArtificial(_TieteArtificial):
+    """Regra de cálculo para Nova Avanhandava Artificial."""
 
-    def calcular(self) -> pd.Series:
-        """
-        Aplica regra de cálculo de Ilha Solteira Artificial.
+    nova_avanhandava: pd.Series
 
-        Returns
-        -------
-        pd.Series
-            Valores de vazão com regra de cálculo.
-        """
-        vazao = (
-            (self.tres_irmaos + self.ilha_solteira)
-            - 0.1 * (self.esouza - self.guarapiranga - self.billings)
-            - self.guarapiranga
-            - self.billings
-        )
-        vazao.name = codigos.ilha_solteira_equiv
+    naturais = ("nova_avanhandava",)
+    codigo = codigos.nova_avanhandava_artificial
 
-        return vazao
 
+class TresIrmaosArtificial(_TieteArtificial):
+    """Regra de cálculo para Três Irmãos Artificial."""
 
-class JupiaArtificial:
-    """Regra de cálculo de usina artificial."""
+    tres_irmaos: pd.Series
 
-    def __init__(self, df: pd.DataFrame) -> None:
-        """
-        Regra de Cálculo para Jupiá Artificial.
+    naturais = ("tres_irmaos",)
+    codigo = codigos.tres_irmaos_artificial
 
-        Parameters
-        ----------
-        df : pd.DataFrame
-            Dataframe com série diária de valores de vazão.
-        """
-        self.jupia = df[codigos.jupia]
-        self.esouza = df[codigos.edgard_souza_com_tributarios]
-        self.guarapiranga = df[codigos.guarapiranga]
-        self.billings = df[codigos.billings]
 
-    def calcular(self) -> pd.Series:
-        """
-        Aplica regra de cálculo de Jupiá Artificial.
+class IlhaSolteiraEquivalente(_TieteArtificial):
+    """Regra de cálculo para Ilha Solteira Artificial."""
 
-        Returns
-        -------
-        pd.Series
-            Valores de vazão com regra de cálculo.
-        """
-        vazao = (
-            self.jupia
-            - 0.1 * (self.esouza - self.guarapiranga - self.billings)
-            - self.guarapiranga
-            - self.billings
-        )
-        vazao.name = codigos.jupia_artificial
+    tres_irmaos: pd.Series
+    ilha_solteira: pd.Series
 
-        return vazao
+    naturais = ("tres_irmaos", "ilha_solteira")
+    codigo = codigos.ilha_solteira_equiv
 
 
-class PortoPrimaveraArtificial:
-    """Regra de cálculo de usina artificial."""
+class JupiaArtificial(_TieteArtificial):
+    """Regra de cálculo para Jupiá Artificial."""
 
-    def __init__(self, df: pd.DataFrame) -> None:
-        """
-        Regra de Cálculo para Porto Primavera Artificial.
+    jupia: pd.Series
 
-        Parameters
-        ----------
-        df : pd.DataFrame
-            Dataframe com série diária de valores de vazão.
-        """
-        self.porto_primavera = df[codigos.porto_primavera]
-        self.esouza = df[codigos.edgard_souza_com_tributarios]
-        self.guarapiranga = df[codigos.guarapiranga]
-        self.billings = df[codigos.billings]
+    naturais = ("jupia",)
+    codigo = codigos.jupia_artificial
 
-    def calcular(self) -> pd.Series:
-        """
-        Aplica regra de cálculo de Porto Primavera Artificial.
 
-        Returns
-        -------
-        pd.Series
-            Valores de vazão com regra de cálculo.
-        """
-        vazao = (
-            self.porto_primavera
-            - 0.1 * (self.esouza - self.guarapiranga - self.billings)
-            - self.guarapiranga
-            - self.billings
-        )
-        vazao.name = codigos.porto_primavera_artificial
+class PortoPrimaveraArtificial(_TieteArtificial):
+    """Regra de cálculo para Porto Primavera Artificial."""
 
-        return vazao
+    porto_primavera: pd.Series
 
+    naturais = ("porto_primavera",)
+    codigo = codigos.porto_primavera_artificial
 
-class ItaipuArtificial:
-    """Regra de cálculo de usina artificial."""
-
-    def __init__(self, df: pd.DataFrame) -> None:
-        """
-        Regra de Cálculo para Itaipu Artificial.
-
-        Parameters
-        ----------
-        df : pd.DataFrame
-            Dataframe com série diária de valores de vazão.
-        """
-        self.itaipu = df[codigos.itaipu]
-        self.esouza = df[codigos.edgard_souza_com_tributarios]
-        self.guarapiranga = df[codigos.guarapiranga]
-        self.billings = df[codigos.billings]
 
-    def calcular(self) -> pd.Series:
-        """
-        Aplica regra de cálculo de Itaipu Artificial.
+class ItaipuArtificial(_TieteArtificial):
+    """Regra de cálculo para Itaipu Artificial."""
 
-        Returns
-        -------
-        pd.Series
-            Valores de vazão com regra de cálculo.
-        """
-        vazao = (
-            self.itaipu
-            - 0.1 * (self.esouza - self.guarapiranga - self.billings)
-            - self.guarapiranga
-            - self.billings
-        )
-        vazao.name = codigos.itaipu_artificial
+    itaipu: pd.Series
 
-        return vazao
+    naturais = ("itaipu",)
+    codigo = codigos.itaipu_artificial
 
 
 class BombeamentoSantaCecilia:
@@ -635,6 +512,9 @@ class BombeamentoSantaCecilia:
         """
         Calcula a vazão do Bombeamento ocorrido em Santa Cecília.
 
+        Aplica a regra a um único valor; `calcular` usa a versão vetorizada
+        `__bombear__`.
+
         Parameters
         ----------
         vazao : float
@@ -645,16 +525,31 @@ class BombeamentoSantaCecilia:
         float
             Vazão bombeada.
         """
-        if vazao <= self.limite_inferior:
-            nova_vazao = (vazao * 119) / 190
-        elif self.limite_inferior < vazao <= self.limite_intermediario:
-            nova_vazao = 119
-        elif self.limite_intermediario < vazao <= self.limite_superior:
-            nova_vazao = vazao - 90
-        else:
-            nova_vazao = 160
+        return float(self.__bombear__(np.asarray(vazao)))
 
-        return nova_vazao
+    def __bombear__(self, vazao: np.ndarray) -> np.ndarray:
+        """
+        Calcula a vazão do Bombeamento ocorrido em Santa Cecília.
+
+        Parameters
+        ----------
+        vazao : np.ndarray
+            Valores da vazão em Santa Cecília.
+
+        Returns
+        -------
+        np.ndarray
+            Vazão bombeada.
+        """
+        return np.select(
+            [
+                vazao <= self.limite_inferior,
+                vazao <= self.limite_intermediario,
+                vazao <= self.limite_superior,
+            ],
+            [(vazao * 119) / 190, 119, vazao - 90],
+            default=160,
+        )
 
     def calcular(self) -> pd.Series:
         """
@@ -665,8 +560,11 @@ class BombeamentoSantaCecilia:
         pd.Series
             Valores de vazão com regra de cálculo.
         """
-        vazao = self.santa_cecilia.apply(self.bombear)
-        vazao.name = codigos.bombeamento_santa_cecilia
+        vazao = pd.Series(
+            self.__bombear__(self.santa_cecilia.to_numpy()),
+            index=self.santa_cecilia.index,
+            name=codigos.bombeamento_santa_cecilia,
+        )
 
         return vazao
 
@@ -689,6 +587,9 @@ class VertimentoTocos:
         """
         Define o valor da vazão vertida.
 
+        Aplica a regra a um único valor; `calcular` usa a versão vetorizada
+        `__verter__`.
+
         Parameters
         ----------
         vazao : float
@@ -699,7 +600,24 @@ class VertimentoTocos:
         float
             Valor de vazão vertida.
         """
-        return max(0, vazao - 25)
+        return float(self.__verter__(np.asarray(vazao)))
+
+    def __verter__(self, vazao: np.ndarray) -> np.ndarray:
+        """
+        Define o valor da vazão vertida.
+
+        Parameters
+        ----------
+        vazao : np.ndarray
+            Vazão de Tocos.
+
+        Returns
+        -------
+        np.ndarray
+            Valor de vazão vertida.
+        """
+        vertimento: np.ndarray = np.fmax(vazao - 25, 0)
+        return vertimento
 
     def calcular(self) -> pd.Series:
         """
@@ -710,8 +628,11 @@ class VertimentoTocos:
         pd.Series
             Valores de vazão com regra de cálculo.
         """
-        vazao = self.tocos.apply(self.verter)
-        vazao.name = codigos.vertimento_tocos
+        vazao = pd.Series(
+            self.__verter__(self.tocos.to_numpy()),
+            index=self.tocos.index,
+            name=codigos.vertimento_tocos,
+        )
 
         return vazao
 
@@ -745,8 +666,11 @@ class SantanaNatural:
         pd.Series
             Valores de vazão com regra de cálculo.
         """
-        vazao = (self.tocos + self.lajes) * self.fator
-        vazao.name = codigos.santana
+        vazao = pd.Series(
+            (self.tocos.to_numpy() + self.lajes.to_numpy()) * self.fator,
+            index=self.tocos.index,
+            name=codigos.santana,
+        )
 
         return vazao
 
@@ -763,10 +687,10 @@ class SantanaArtificial:
         df : pd.DataFrame
             Dataframe com série diária de valores de vazão.
         """
-        self.santana = SantanaNatural(df).calcular()
+        self.santana = calcular_regra(SantanaNatural, df)
         self.tocos = df[codigos.tocos]
-        self.vertimento_tocos = VertimentoTocos(df).calcular()
-        self.bombeamento_santa_cecilia = BombeamentoSantaCecilia(df).calcular()
+        self.vertimento_tocos = calcular_regra(VertimentoTocos, df)
+        self.bombeamento_santa_cecilia = calcular_regra(BombeamentoSantaCecilia, df)
 
     def calcular(self) -> pd.Series:
         """
@@ -777,12 +701,13 @@ class SantanaArtificial:
         pd.Series
             Valores de vazão com regra de cálculo.
         """
-        vazao = (
-            (self.santana - self.tocos)
-            + self.vertimento_tocos
-            + self.bombeamento_santa_cecilia
+        vazao = pd.Series(
+            (self.santana.to_numpy() - self.tocos.to_numpy())
+            + self.vertimento_tocos.to_numpy()
+            + self.bombeamento_santa_cecilia.to_numpy(),
+            index=self.santana.index,
+            name=codigos.santana_artificial,
         )
-        vazao.name = codigos.santana_artificial
 
         return vazao
 
@@ -799,13 +724,16 @@ class VigarioArtificial:
         df : pd.DataFrame
             Dataframe com série diária de valores de vazão.
         """
-        self.santana_artificial = SantanaArtificial(df).calcular()
+        self.santana_artificial = calcular_regra(SantanaArtificial, df)
         self.limite = 190
 
     def escolher(self, vazao: float) -> float:
         """
         Escolhe o valor mínimo de vazão entre o posto Santana e o limite mínimo.
 
+        Aplica a regra a um único valor; `calcular` usa a versão vetorizada
+        `__escolher__`.
+
         Parameters
         ----------
         vazao : float
@@ -814,9 +742,26 @@ class VigarioArtificial:
         Returns
         -------
         float
-            Valor escolhido.
+            Valores escolhidos.
+        """
+        return float(self.__escolher__(np.asarray(vazao)))
+
+    def __escolher__(self, vazao: np.ndarray) -> np.ndarray:
+        """
+        Escolhe o valor mínimo de vazão entre o posto Santana e o limite mínimo.
+
+        Parameters
+        ----------
+        vazao : np.ndarray
+            Valores de vazão de Santana
+
+        Returns
+        -------
+        np.ndarray
+            Valores escolhidos.
         """
-        return min(vazao, self.limite)
+        vazao_escolhida: np.ndarray = np.minimum(vazao, self.limite)
+        return vazao_escolhida
 
     def calcular(self) -> pd.Series:
         """
@@ -827,8 +772,11 @@ class VigarioArtificial:
         pd.Series
             Valores de vazão com regra de cálculo.
         """
-        vazao = self.santana_artificial.apply(self.escolher)
-        vazao.name = codigos.vigario
+        vazao = pd.Series(
+            self.__escolher__(self.santana_artificial.to_numpy()),
+            index=self.santana_artificial.index,
+            name=codigos.vigario,
+        )
 
         return vazao
 
@@ -845,8 +793,8 @@ class VertimentoSantana:
         df : pd.DataFrame
             Dataframe com série diária de valores de vazão.
         """
-        self.santana_artificial = SantanaArtificial(df).calcular()
-        self.vigario_artificial = VigarioArtificial(df).calcular()
+        self.santana_artificial = calcular_regra(SantanaArtificial, df)
+        self.vigario_artificial = calcular_regra(VigarioArtificial, df)
 
     def calcular(self) -> pd.Series:
         """
@@ -857,8 +805,11 @@ class VertimentoSantana:
         pd.Series
             Valores de vazão com regra de cálculo.
         """
-        vazao = self.santana_artificial - self.vigario_artificial
-        vazao.name = codigos.santana_vertimento
+        vazao = pd.Series(
+            self.santana_artificial.to_numpy() - self.vigario_artificial.to_numpy(),
+            index=self.santana_artificial.index,
+            name=codigos.santana_vertimento,
+        )
 
         return vazao
 
@@ -876,9 +827,9 @@ class AntaArtificial:
             Dataframe com série diária de valores de vazão.
         """
         self.anta = df[codigos.anta]
-        self.bombeamento_santa_cecilia = BombeamentoSantaCecilia(df).calcular()
-        self.santana = SantanaNatural(df).calcular()
-        self.vertimento_santana = VertimentoSantana(df).calcular()
+        self.bombeamento_santa_cecilia = calcular_regra(BombeamentoSantaCecilia, df)
+        self.santana = calcular_regra(SantanaNatural, df)
+        self.vertimento_santana = calcular_regra(VertimentoSantana, df)
 
     def calcular(self) -> pd.Series:
         """
@@ -889,13 +840,14 @@ class AntaArtificial:
         pd.Series
             Valores de vazão com regra de cálculo.
         """
-        vazao = (
-            self.anta
-            - self.bombeamento_santa_cecilia
-            - self.santana
-            + self.vertimento_santana
+        vazao = pd.Series(
+            self.anta.to_numpy()
+            - self.bombeamento_santa_cecilia.to_numpy()
+            - self.santana.to_numpy()
+            + self.vertimento_santana.to_numpy(),
+            index=self.anta.index,
+            name=codigos.anta_artificial,
         )
-        vazao.name = codigos.anta_artificial
 
         return vazao
 
@@ -923,29 +875,43 @@ class SimplicioArtificial:
         limite : int
             Limite do intervalo de vazão, by default 430
         """
-        self.anta = AntaArtificial(df).calcular()
+        self.anta = calcular_regra(AntaArtificial, df)
         self.limite = limite
 
     def escolher(self, vazao: float) -> float:
         """
         Calcula a vazão artificial de Simplício.
 
+        Aplica a regra a um único valor; `calcular` usa a versão vetorizada
+        `__escolher__`.
+
         Parameters
         ----------
         vazao : float
-            Valor da vazão em Santa Cecília.
+            Valor da vazão em Anta Artificial.
 
         Returns
         -------
         float
-            Vazão bombeada.
+            Vazão artificial de Simplício.
+        """
+        return float(self.__escolher__(np.asarray(vazao)))
+
+    def __escolher__(self, vazao: np.ndarray) -> np.ndarray:
         """
-        if vazao <= self.limite:
-            nova_vazao = max(0, vazao - 90)
-        else:
-            nova_vazao = 340
+        Calcula a vazão artificial de Simplício.
 
-        return nova_vazao
+        Parameters
+        ----------
+        vazao : np.ndarray
+            Valores da vazão em Anta Artificial.
+
+        Returns
+        -------
+        np.ndarray
+            Vazão artificial de Simplício.
+        """
+        return np.where(vazao <= self.limite, np.maximum(vazao - 90, 0), 340)
 
     def calcular(self) -> pd.Series:
         """
@@ -956,8 +922,11 @@ class SimplicioArtificial:
         pd.Series
             Valores de vazão com regra de cálculo.
         """
-        vazao = self.anta.apply(self.escolher)
-        vazao.name = codigos.simplicio_artificial
+        vazao = pd.Series(
+            self.__escolher__(self.anta.to_numpy()),
+            index=self.anta.index,
+            name=codigos.simplicio_artificial,
+        )
 
         return vazao
 
@@ -975,9 +944,9 @@ class IlhaPombosArtificial:
             Dataframe com série diária de valores de vazão.
         """
         self.ilha_pombos = df[codigos.ilha_pombos]
-        self.bombeamento_santa_cecila = BombeamentoSantaCecilia(df).calcular()
-        self.santana = SantanaNatural(df).calcular()
-        self.vertimento_santana = VertimentoSantana(df).calcular()
+        self.bombeamento_santa_cecila = calcular_regra(BombeamentoSantaCecilia, df)
+        self.santana = calcular_regra(SantanaNatural, df)
+        self.vertimento_santana = calcular_regra(VertimentoSantana, df)
 
     def calcular(self) -> pd.Series:
         """
@@ -988,13 +957,14 @@ class IlhaPombosArtificial:
         pd.Series
             Valores de vazão com regra de cálculo.
         """
-        vazao = (
-            self.ilha_pombos
-            - self.bombeamento_santa_cecila
-            - self.santana
-            + self.vertimento_santana
+        vazao = pd.Series(
+            self.ilha_pombos.to_numpy()
+            - self.bombeamento_santa_cecila.to_numpy()
+            - self.santana.to_numpy()
+            + self.vertimento_santana.to_numpy(),
+            index=self.ilha_pombos.index,
+            name=codigos.ilha_pombos_artificial,
         )
-        vazao.name = codigos.ilha_pombos_artificial
 
         return vazao
 
@@ -1011,24 +981,44 @@ class NiloPecanhaArtificial:
         df : pd.DataFrame
             Dataframe com série diária de valores de vazão.
         """
-        self.vigario_artificial = VigarioArtificial(df).calcular()
+        self.vigario_artificial = calcular_regra(VigarioArtificial, df)
         self.limite = 144
 
     def escolher(self, vazao: float) -> float:
         """
         Escolhe o valor mínimo de vazão entre o Vigário Artificial e o limite mínimo.
 
+        Aplica a regra a um único valor; `calcular` usa a versão vetorizada
+        `__escolher__`.
+
         Parameters
         ----------
         vazao : float
-            Valor de vazão de Santana
+            Valor de vazão de Vigário Artificial.
 
         Returns
         -------
         float
-            Valor escolhido.
+            Valores escolhidos.
+        """
+        return float(self.__escolher__(np.asarray(vazao)))
+
+    def __escolher__(self, vazao: np.ndarray) -> np.ndarray:
         """
-        return min(vazao, self.limite)
+        Escolhe o valor mínimo de vazão entre o Vigário Artificial e o limite mínimo.
+
+        Parameters
+        ----------
+        vazao : np.ndarray
+            Valores de vazão de Vigário Artificial.
+
+        Returns
+        -------
+        np.ndarray
+            Valores escolhidos.
+        """
+        vazao_escolhida: np.ndarray = np.minimum(vazao, self.limite)
+        return vazao_escolhida
 
     def calcular(self) -> pd.Series:
         """
@@ -1039,8 +1029,11 @@ class NiloPecanhaArtificial:
         pd.Series
             Valores de vazão com regra de cálculo.
         """
-        vazao = self.vigario_artificial.apply(self.escolher)
-        vazao.name = codigos.nilo_pecanha_artificial
+        vazao = pd.Series(
+            self.__escolher__(self.vigario_artificial.to_numpy()),
+            index=self.vigario_artificial.index,
+            name=codigos.nilo_pecanha_artificial,
+        )
 
         return vazao
 
@@ -1063,21 +1056,43 @@ class LajesArtificial:
 
     def escolher(self, tocos: float, lajes: float) -> float:
         """
-        Escolhe o valor mínimo de vazão entre o Vigário Artificial e o limite mínimo.
+        Soma à vazão de Lajes a vazão de Tocos, limitada ao desvio máximo.
+
+        Aplica a regra a um único valor; `calcular` usa a versão vetorizada
+        `__escolher__`.
 
         Parameters
         ----------
         tocos : float
             Valor de vazão de Tocos.
-        Lajes : float
+        lajes : float
             Valor de vazão de Lajes.
 
         Returns
         -------
         float
-            Valor escolhido.
+            Valores escolhidos.
         """
-        return lajes + min(tocos, self.limite)
+        return float(self.__escolher__(np.asarray(tocos), np.asarray(lajes)))
+
+    def __escolher__(self, tocos: np.ndarray, lajes: np.ndarray) -> np.ndarray:
+        """
+        Soma à vazão de Lajes a vazão de Tocos, limitada ao desvio máximo.
+
+        Parameters
+        ----------
+        tocos : np.ndarray
+            Valores de vazão de Tocos.
+        lajes : np.ndarray
+            Valores de vazão de Lajes.
+
+        Returns
+        -------
+        np.ndarray
+            Valores escolhidos.
+        """
+        vazao_escolhida: np.ndarray = lajes + np.minimum(tocos, self.limite)
+        return vazao_escolhida
 
     def calcular(self) -> pd.Series:
         """
@@ -1088,15 +1103,13 @@ class LajesArtificial:
         pd.Series
             Valores de vazão com regra de cálculo.
         """
-        vazao = list()
-        for lajes, tocos in zip(self.lajes, self.tocos):
-            valor = self.escolher(tocos, lajes)
-            vazao.append(valor)
-
-        serie = pd.Series(vazao, index=self.lajes.index)
-        serie.name = codigos.lajes_artificial
+        vazao = pd.Series(
+            self.__escolher__(self.tocos.to_numpy(), self.lajes.to_numpy()),
+            index=self.tocos.index,
+            name=codigos.lajes_artificial,
+        )
 
-        return serie
+        return vazao
 
 
 class FontesArtificial:
@@ -1111,35 +1124,63 @@ class FontesArtificial:
         df : pd.DataFrame
             Dataframe com série diária de valores de vazão.
         """
-        self.lajes = LajesArtificial(df).calcular()
-        self.vigario_artificial = VigarioArtificial(df).calcular()
-        self.nilo_pecanha_artificial = NiloPecanhaArtificial(df).calcular()
+        self.lajes = calcular_regra(LajesArtificial, df)
+        self.vigario_artificial = calcular_regra(VigarioArtificial, df)
+        self.nilo_pecanha_artificial = calcular_regra(NiloPecanhaArtificial, df)
         self.limite = 17
 
     def escolher(self, lajes: float, vigario: float, nilo_pecanha: float) -> float:
         """
         Escolhe o valor mínimo de vazão entre o Fontes Artificial e o limite mínimo.
 
+        Aplica a regra a um único valor; `calcular` usa a versão vetorizada
+        `__escolher__`.
+
         Parameters
         ----------
-        tocos : float
-            Valor de vazão de Tocos.
-        Lajes : float
-            Valor de vazão de Lajes.
+        lajes : float
+            Valor de vazão de Lajes Artificial.
+        vigario : float
+            Valor de vazão de Vigário Artificial.
         nilo_pecanha : float
             Valor de vazão de Nilo Peçanha.
 
         Returns
         -------
         float
-            Valor escolhido.
+            Valores escolhidos.
+        """
+        return float(
+            self.__escolher__(
+                np.asarray(lajes), np.asarray(vigario), np.asarray(nilo_pecanha)
+            )
+        )
+
+    def __escolher__(
+        self, lajes: np.ndarray, vigario: np.ndarray, nilo_pecanha: np.ndarray
+    ) -> np.ndarray:
         """
-        if lajes < self.limite:
-            nova_vazao = lajes
-        else:
-            nova_vazao = self.limite + min(vigario - nilo_pecanha, 34)
+        Escolhe o valor mínimo de vazão entre o Fontes Artificial e o limite mínimo.
+
+        Parameters
+        ----------
+        lajes : np.ndarray
+            Valores de vazão de Lajes Artificial.
+        vigario : np.ndarray
+            Valores de vazão de Vigário Artificial.
+        nilo_pecanha : np.ndarray
+            Valores de vazão de Nilo Peçanha.
 
-        return nova_vazao
+        Returns
+        -------
+        np.ndarray
+            Valores escolhidos.
+        """
+        return np.where(
+            lajes < self.limite,
+            lajes,
+            self.limite + np.minimum(vigario - nilo_pecanha, 34),
+        )
 
     def calcular(self) -> pd.Series:
         """
@@ -1150,17 +1191,17 @@ class FontesArtificial:
         pd.Series
             Valores de vazão com regra de cálculo.
         """
-        vazao = list()
-        for lajes, vigario_artificial, nilo_pecanha in zip(
-            self.lajes, self.vigario_artificial, self.nilo_pecanha_artificial
-        ):
-            valor = self.escolher(lajes, vigario_artificial, nilo_pecanha)
-            vazao.append(valor)
-
-        serie = pd.Series(vazao, index=self.lajes.index)
-        serie.name = codigos.fontes_artificial
+        vazao = pd.Series(
+            self.__escolher__(
+                self.lajes.to_numpy(),
+                self.vigario_artificial.to_numpy(),
+                self.nilo_pecanha_artificial.to_numpy(),
+            ),
+            index=self.lajes.index,
+            name=codigos.fontes_artificial,
+        )
 
-        return serie
+        return vazao
 
 
 class PereiraPassosArtificial:
@@ -1175,8 +1216,8 @@ class PereiraPassosArtificial:
         df : pd.DataFrame
             Dataframe com série diária de valores de vazão.
         """
-        self.fontes = FontesArtificial(df).calcular()
-        self.nilo_pecanha_artificial = NiloPecanhaArtificial(df).calcular()
+        self.fontes = calcular_regra(FontesArtificial, df)
+        self.nilo_pecanha_artificial = calcular_regra(NiloPecanhaArtificial, df)
 
     def calcular(self) -> pd.Series:
         """
@@ -1187,8 +1228,11 @@ class PereiraPassosArtificial:
         pd.Series
             Valores de vazão com regra de cálculo.
         """
-        vazao = self.fontes + self.nilo_pecanha_artificial
-        vazao.name = codigos.pereira_passos_artificial
+        vazao = pd.Series(
+            self.fontes.to_numpy() + self.nilo_pecanha_artificial.to_numpy(),
+            index=self.fontes.index,
+            name=codigos.pereira_passos_artificial,
+        )
 
         return vazao
 
@@ -1216,8 +1260,11 @@ class ItutingaNatural:
         pd.Series
             Valores de vazão com regra de cálculo.
         """
-        vazao = self.camargos.copy()
-        vazao.name = codigos.itutinga
+        vazao = pd.Series(
+            self.camargos.to_numpy(copy=True),
+            index=self.camargos.index,
+            name=codigos.itutinga,
+        )
 
         return vazao
 
@@ -1245,8 +1292,11 @@ class PauloAfonsoNatural:
         pd.Series
             Valores de vazão com regra de cálculo.
         """
-        vazao = self.moxoto.copy()
-        vazao.name = codigos.paulo_afonso
+        vazao = pd.Series(
+            self.moxoto.to_numpy(copy=True),
+            index=self.moxoto.index,
+            name=codigos.paulo_afonso,
+        )
 
         return vazao
 
@@ -1274,8 +1324,11 @@ class ComplexoNatural:
         pd.Series
             Valores de vazão com regra de cálculo.
         """
-        vazao = self.moxoto.copy()
-        vazao.name = codigos.complexo
+        vazao = pd.Series(
+            self.moxoto.to_numpy(copy=True),
+            index=self.moxoto.index,
+            name=codigos.complexo,
+        )
 
         return vazao
 
@@ -1299,17 +1352,37 @@ class JordaoArtificial:
         """
         Define o valor da vazão desviada.
 
+        Aplica a regra a um único valor; `calcular` usa a versão vetorizada
+        `__desviar__`.
+
         Parameters
         ----------
         vazao : float
-            Vazão de Tocos.
+            Vazão de Jordão.
 
         Returns
         -------
         float
             Valor de vazão vertida.
         """
-        return vazao - min(self.limite, vazao - 10)
+        return float(self.__desviar__(np.asarray(vazao)))
+
+    def __desviar__(self, vazao: np.ndarray) -> np.ndarray:
+        """
+        Define o valor da vazão desviada.
+
+        Parameters
+        ----------
+        vazao : np.ndarray
+            Vazão de Jordão.
+
+        Returns
+        -------
+        np.ndarray
+            Valor de vazão vertida.
+        """
+        desvio: np.ndarray = vazao - np.minimum(self.limite, vazao - 10)
+        return desvio
 
     def calcular(self) -> pd.Series:
         """
@@ -1320,8 +1393,11 @@ class JordaoArtificial:
         pd.Series
             Valores de vazão com regra de cálculo.
         """
-        vazao = self.jordao.apply(self.desviar)
-        vazao.name = codigos.jordao_artificial
+        vazao = pd.Series(
+            self.__desviar__(self.jordao.to_numpy()),
+            index=self.jordao.index,
+            name=codigos.jordao_artificial,
+        )
 
         return vazao
 
@@ -1346,6 +1422,9 @@ class SegredoArtificial:
         """
         Define o valor da vazão desviada.
 
+        Aplica a regra a um único valor; `calcular` usa a versão vetorizada
+        `__desviar__`.
+
         Parameters
         ----------
         jordao : float
@@ -1358,7 +1437,25 @@ class SegredoArtificial:
         float
             Valor de vazão vertida.
         """
-        desvio: float = segredo + min(jordao - 10, self.limite)
+        return float(self.__desviar__(np.asarray(jordao), np.asarray(segredo)))
+
+    def __desviar__(self, jordao: np.ndarray, segredo: np.ndarray) -> np.ndarray:
+        """
+        Define o valor da vazão desviada.
+
+        Parameters
+        ----------
+        jordao : np.ndarray
+            Vazão de Jordão.
+        segredo : np.ndarray
+            Vazão de Segredo.
+
+        Returns
+        -------
+        np.ndarray
+            Valor de vazão vertida.
+        """
+        desvio: np.ndarray = segredo + np.minimum(jordao - 10, self.limite)
         return desvio
 
     def calcular(self) -> pd.Series:
@@ -1370,12 +1467,11 @@ class SegredoArtificial:
         pd.Series
             Valores de vazão com regra de cálculo.
         """
-        segredo_art = list()
-        for jordao, segredo in zip(self.jordao, self.segredo):
-            segredo_art.append(self.desviar(jordao, segredo))
-
-        vazao = pd.Series(segredo_art, index=self.segredo.index)
-        vazao.name = codigos.segredo_artificial
+        vazao = pd.Series(
+            self.__desviar__(self.jordao.to_numpy(), self.segredo.to_numpy()),
+            index=self.segredo.index,
+            name=codigos.segredo_artificial,
+        )
 
         return vazao
 
@@ -1403,8 +1499,11 @@ class ItiquiraII:
         pd.Series
             Valores de vazão com regra de cálculo.
         """
-        vazao = self.itiquira1.copy()
-        vazao.name = codigos.itiquira2
+        vazao = pd.Series(
+            self.itiquira1.to_numpy(copy=True),
+            index=self.itiquira1.index,
+            name=codigos.itiquira2,
+        )
 
         return vazao
 
@@ -1423,12 +1522,30 @@ class BeloMonteArtificial:
         hidrograma : pd.DataFrame
             Vazões do hidrograma (médio) de Belo Monte por mês.
         """
-        self.pimental = pd.DataFrame(df[codigos.pimental]).rename(
-            {288: "pimental"}, axis=1
-        )
+        self.pimental = df[codigos.pimental].to_frame("pimental")
         self.desvio_maximo = 13900
         self.hidrograma = hidrograma
 
+    def __hidrograma_diario__(self) -> np.ndarray:
+        """
+        Expande o hidrograma mensal para a série diária de Pimental.
+
+        Returns
+        -------
+        np.ndarray
+            Valor do hidrograma referente ao mês de cada dia da série.
+        """
+        meses = self.hidrograma["mes"].to_numpy(dtype=np.float64)
+        validos = np.isin(meses, np.arange(1, 13))
+        hidrograma_por_mes = np.full(13, np.nan)
+        hidrograma_por_mes[meses[validos].astype(np.intp)] = self.hidrograma[
+            "vazao"
+        ].to_numpy()[validos]
+        meses_serie = self.pimental.index.month  # type: ignore
+        hidrograma: np.ndarray = hidrograma_por_mes[meses_serie]
+
+        return hidrograma
+
     def preparar(self) -> pd.DataFrame:
         """
         Prepara os dados para o cálculo do desvio.
@@ -1441,20 +1558,20 @@ class BeloMonteArtificial:
         pd.DataFrame
             Dataframe contendo vazão de pimental e valores do hidrograma.
         """
-        df = self.pimental.copy()
-        idx = df.index
+        df = self.pimental.assign(hidrograma=self.__hidrograma_diario__())
 
-        df["mes"] = df.index.month  # type: ignore
-        df = df.merge(self.hidrograma, how="left", on="mes")
-        df = df.rename({"vazao": "hidrograma"}, axis=1)
-        df.index = idx
-
-        return df[["pimental", "hidrograma"]]
+        return df
 
     def desviar(self, pimental: float, hidrograma: float) -> float:
         """
         Cálcula o desvio de água entre os reservatórios de Pimental e Belo Monte.
 
+        Aplica a regra a um único valor; `calcular` usa a versão vetorizada
+        `__desviar__`.
+
+        O desvio é o excedente de Pimental sobre o hidrograma, limitado entre zero e
+        o desvio máximo.
+
         Parameters
         ----------
         pimental : float
@@ -1467,14 +1584,29 @@ class BeloMonteArtificial:
         float
             Vazão desviada.
         """
-        if pimental < hidrograma:
-            vazao_desviada = 0.0
-        elif pimental > hidrograma + self.desvio_maximo:
-            vazao_desviada = self.desvio_maximo
-        else:
-            vazao_desviada = pimental - hidrograma
+        return float(self.__desviar__(np.asarray(pimental), np.asarray(hidrograma)))
 
-        return vazao_desviada
+    def __desviar__(self, pimental: np.ndarray, hidrograma: np.ndarray) -> np.ndarray:
+        """
+        Cálcula o desvio de água entre os reservatórios de Pimental e Belo Monte.
+
+        O desvio é o excedente de Pimental sobre o hidrograma, limitado entre zero e
+        o desvio máximo.
+
+        Parameters
+        ----------
+        pimental : np.ndarray
+            Vazão no posto de Pimental
+        hidrograma : np.ndarray
+            Valor limite do hidrograma médio
+
+        Returns
+        -------
+        np.ndarray
+            Vazão desviada.
+        """
+        desvio: np.ndarray = np.clip(pimental - hidrograma, 0.0, self.desvio_maximo)
+        return desvio
 
     def calcular(self) -> pd.Series:
         """
@@ -1485,13 +1617,13 @@ class BeloMonteArtificial:
         pd.Series
             Valores de vazão com regra de cálculo.
         """
-        df = self.preparar()
-        belomonte = list()
-        for row in df.itertuples():
-            belomonte.append(self.desviar(row.pimental, row.hidrograma))  # type: ignore
-
-        vazao = pd.Series(belomonte, index=self.pimental.index)
-        vazao.name = codigos.belo_monte_artificial
+        pimental = self.pimental["pimental"].to_numpy()
+        hidrograma = self.__hidrograma_diario__().astype(pimental.dtype)
+        vazao = pd.Series(
+            self.__desviar__(pimental, hidrograma),
+            index=self.pimental.index,
+            name=codigos.belo_monte_artificial,
+        )
 
         return vazao
 
@@ -1511,7 +1643,7 @@ class PimentalArtificial:
             Vazões do hidrograma (médio) de Belo Monte por mês.
         """
         self.pimental = df[codigos.pimental]
-        self.belo_monte = BeloMonteArtificial(df, hidrograma).calcular()
+        self.belo_monte = calcular_regra(BeloMonteArtificial, df, hidrograma)
 
     def calcular(self) -> pd.Series:
         """
@@ -1522,7 +1654,10 @@ class PimentalArtificial:
         pd.Series
             Valores de vazão com regra de cálculo.
         """
-        vazao = self.pimental - self.belo_monte
-        vazao.name = codigos.pimental_artificial
+        vazao = pd.Series(
+            self.pimental.to_numpy() - self.belo_monte.to_numpy(),
+            index=self.pimental.index,
+            name=codigos.pimental_artificial,
+        )
 
         return vazao
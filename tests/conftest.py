@@ -0,0 +1,61 @@
+from collections.abc import Callable
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from ena_ons import VazaoENA
+from ena_ons import regras
+
+
+DIRETORIO_DADOS = Path(__file__).parents[1] / "data"
+DIRETORIO_ESPERADOS = Path(__file__).parent / "dados"
+
+
+def ler_vazoes(arquivo: Path) -> pd.DataFrame:
+    vazoes = pd.read_csv(arquivo, index_col="data", parse_dates=True)
+    vazoes.columns = vazoes.columns.astype(float)
+    return vazoes
+
+
+@pytest.fixture
+def vazoes() -> pd.DataFrame:
+    return ler_vazoes(DIRETORIO_DADOS / "vazao.csv")
+
+
+@pytest.fixture
+def produtibilidade() -> pd.DataFrame:
+    return pd.read_csv(DIRETORIO_DADOS / "produtibilidade.csv")
+
+
+@pytest.fixture
+def hidrograma() -> pd.DataFrame:
+    return pd.read_csv(DIRETORIO_DADOS / "hidrograma.csv")
+
+
+@pytest.fixture
+def agrupamentos() -> pd.DataFrame:
+    return pd.read_csv(DIRETORIO_DADOS / "agrupamentos.csv")
+
+
+@pytest.fixture
+def vazoes_artificiais_esperadas() -> pd.DataFrame:
+    return ler_vazoes(DIRETORIO_ESPERADOS / "vazoes_artificiais.csv")
+
+
+@pytest.fixture
+def ena(vazoes: pd.DataFrame, produtibilidade: pd.DataFrame) -> VazaoENA:
+    return VazaoENA(vazoes, produtibilidade)
+
+
+@pytest.fixture
+def calculos(monkeypatch: pytest.MonkeyPatch) -> list[str]:
+    chamadas: list[str] = []
+    original = regras.calcular_regra
+
+    def contar(regra: Callable[..., regras.Regra], *args: pd.DataFrame) -> pd.Series:
+        chamadas.append(getattr(regra, "__name__", str(regra)))
+        return original(regra, *args)
+
+    monkeypatch.setattr(regras, "calcular_regra", contar)
+    return chamadas
@@ -0,0 +1,270 @@
+import os
+import pickle
+import threading
+import time
+
+from datetime import timedelta
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from ena_ons import VazaoENA
+
+
+class Plantado:
+    def __init__(self, sentinela: Path) -> None:
+        self.sentinela = sentinela
+
+    def __reduce__(self) -> tuple:
+        return (Path.touch, (self.sentinela,))
+
+
+def arquivos_cache(diretorio: Path) -> list[Path]:
+    return sorted(diretorio.iterdir())
+
+
+def test_cache_reaproveitado_entre_instancias(
+    tmp_path: Path,
+    vazoes: pd.DataFrame,
+    produtibilidade: pd.DataFrame,
+    hidrograma: pd.DataFrame,
+    vazoes_artificiais_esperadas: pd.DataFrame,
+    calculos: list[str],
+) -> None:
+    VazaoENA(
+        vazoes, produtibilidade, diretorio_cache=tmp_path
+    ).adicionar_vazoes_artificiais(hidrograma)
+    calculos.clear()
+
+    ena = VazaoENA(vazoes, produtibilidade, diretorio_cache=tmp_path)
+    vazoes_artificiais = ena.adicionar_vazoes_artificiais(hidrograma)
+
+    assert calculos == []
+    assert [arquivo.suffix for arquivo in arquivos_cache(tmp_path)] == [".npz"]
+    pd.testing.assert_frame_equal(
+        vazoes_artificiais, vazoes_artificiais_esperadas, rtol=1e-9, check_freq=False
+    )
+
+
+def test_cache_separado_por_dtype(
+    tmp_path: Path,
+    vazoes: pd.DataFrame,
+    produtibilidade: pd.DataFrame,
+    hidrograma: pd.DataFrame,
+) -> None:
+    for dtype in (np.float64, np.float32):
+        ena = VazaoENA(vazoes, produtibilidade, dtype=dtype, diretorio_cache=tmp_path)
+        vazoes_artificiais = ena.adicionar_vazoes_artificiais(hidrograma)
+        assert (vazoes_artificiais.dtypes == dtype).all()
+
+    assert len(arquivos_cache(tmp_path)) == 2
+
+
+def test_arquivo_corrompido_recalculado(
+    tmp_path: Path,
+    vazoes: pd.DataFrame,
+    produtibilidade: pd.DataFrame,
+    hidrograma: pd.DataFrame,
+    vazoes_artificiais_esperadas: pd.DataFrame,
+) -> None:
+    VazaoENA(
+        vazoes, produtibilidade, diretorio_cache=tmp_path
+    ).adicionar_vazoes_artificiais(hidrograma)
+    (arquivo,) = arquivos_cache(tmp_path)
+    arquivo.write_bytes(b"corrompido")
+
+    ena = VazaoENA(vazoes, produtibilidade, diretorio_cache=tmp_path)
+    vazoes_artificiais = ena.adicionar_vazoes_artificiais(hidrograma)
+
+    pd.testing.assert_frame_equal(
+        vazoes_artificiais, vazoes_artificiais_esperadas, rtol=1e-9, check_freq=False
+    )
+    assert arquivo.read_bytes() != b"corrompido"
+
+
+def test_pickle_plantado_nao_executado(
+    tmp_path: Path,
+    vazoes: pd.DataFrame,
+    produtibilidade: pd.DataFrame,
+    hidrograma: pd.DataFrame,
+    vazoes_artificiais_esperadas: pd.DataFrame,
+) -> None:
+    diretorio = tmp_path / "cache"
+    VazaoENA(
+        vazoes, produtibilidade, diretorio_cache=diretorio
+    ).adicionar_vazoes_artificiais(hidrograma)
+    (arquivo,) = arquivos_cache(diretorio)
+    sentinela = tmp_path / "executado"
+    arquivo.write_bytes(pickle.dumps(Plantado(sentinela)))
+
+    ena = VazaoENA(vazoes, produtibilidade, diretorio_cache=diretorio)
+    vazoes_artificiais = ena.adicionar_vazoes_artificiais(hidrograma)
+
+    assert not sentinela.exists()
+    pd.testing.assert_frame_equal(
+        vazoes_artificiais, vazoes_artificiais_esperadas, rtol=1e-9, check_freq=False
+    )
+
+
+def test_gravacao_concorrente_no_mesmo_diretorio(
+    tmp_path: Path,
+    vazoes: pd.DataFrame,
+    produtibilidade: pd.DataFrame,
+    hidrograma: pd.DataFrame,
+    vazoes_artificiais_esperadas: pd.DataFrame,
+) -> None:
+    resultados: list[pd.DataFrame] = []
+    erros: list[BaseException] = []
+
+    def calcular(ena: VazaoENA) -> None:
+        try:
+            resultados.append(ena.adicionar_vazoes_artificiais(hidrograma))
+        except BaseException as erro:
+            erros.append(erro)
+
+    for tentativa in range(20):
+        diretorio = tmp_path / str(tentativa)
+        instancias = [
+            VazaoENA(vazoes, produtibilidade, diretorio_cache=diretorio)
+            for _ in range(8)
+        ]
+        threads = [threading.Thread(target=calcular, args=(ena,)) for ena in instancias]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert [arquivo.suffix for arquivo in arquivos_cache(diretorio)] == [".npz"]
+
+    assert erros == []
+    assert len(resultados) == 20 * 8
+    for vazoes_artificiais in resultados:
+        pd.testing.assert_frame_equal(
+            vazoes_artificiais,
+            vazoes_artificiais_esperadas,
+            rtol=1e-9,
+            check_freq=False,
+        )
+
+
+def test_falha_de_gravacao_nao_impede_calculo(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    vazoes: pd.DataFrame,
+    produtibilidade: pd.DataFrame,
+    hidrograma: pd.DataFrame,
+    vazoes_artificiais_esperadas: pd.DataFrame,
+) -> None:
+    def falhar(*args: object) -> None:
+        raise PermissionError("sem permissão de escrita")
+
+    monkeypatch.setattr(os, "replace", falhar)
+    ena = VazaoENA(vazoes, produtibilidade, diretorio_cache=tmp_path)
+
+    vazoes_artificiais = ena.adicionar_vazoes_artificiais(hidrograma)
+
+    assert arquivos_cache(tmp_path) == []
+    pd.testing.assert_frame_equal(
+        vazoes_artificiais, vazoes_artificiais_esperadas, rtol=1e-9, check_freq=False
+    )
+
+
+def envelhecer(arquivo: Path, segundos: float) -> None:
+    instante = time.time() - segundos
+    os.utime(arquivo, (instante, instante))
+
+
+def test_cache_dentro_da_validade_reaproveitado(
+    tmp_path: Path,
+    vazoes: pd.DataFrame,
+    produtibilidade: pd.DataFrame,
+    hidrograma: pd.DataFrame,
+    calculos: list[str],
+) -> None:
+    validade = timedelta(hours=1)
+    VazaoENA(
+        vazoes, produtibilidade, diretorio_cache=tmp_path, validade_cache=validade
+    ).adicionar_vazoes_artificiais(hidrograma)
+    (arquivo,) = arquivos_cache(tmp_path)
+    envelhecer(arquivo, 1800)
+    calculos.clear()
+
+    VazaoENA(
+        vazoes, produtibilidade, diretorio_cache=tmp_path, validade_cache=validade
+    ).adicionar_vazoes_artificiais(hidrograma)
+
+    assert calculos == []
+
+
+def test_cache_expirado_recalculado_e_regravado(
+    tmp_path: Path,
+    vazoes: pd.DataFrame,
+    produtibilidade: pd.DataFrame,
+    hidrograma: pd.DataFrame,
+    calculos: list[str],
+) -> None:
+    validade = timedelta(hours=1)
+    VazaoENA(
+        vazoes, produtibilidade, diretorio_cache=tmp_path, validade_cache=validade
+    ).adicionar_vazoes_artificiais(hidrograma)
+    (arquivo,) = arquivos_cache(tmp_path)
+    envelhecer(arquivo, 7200)
+    calculos.clear()
+
+    VazaoENA(
+        vazoes, produtibilidade, diretorio_cache=tmp_path, validade_cache=validade
+    ).adicionar_vazoes_artificiais(hidrograma)
+
+    assert calculos
+    assert arquivos_cache(tmp_path) == [arquivo]
+    assert time.time() - arquivo.stat().st_mtime < validade.total_seconds()
+
+
+def test_entradas_expiradas_de_outros_dados_removidas(
+    tmp_path: Path,
+    vazoes: pd.DataFrame,
+    produtibilidade: pd.DataFrame,
+    hidrograma: pd.DataFrame,
+) -> None:
+    validade = timedelta(hours=1)
+    antiga = tmp_path / "vazoes_artificiais_antiga.npz"
+    temporario = tmp_path / "vazoes_artificiais_interrompida.tmp"
+    recente = tmp_path / "vazoes_artificiais_recente.npz"
+    outro = tmp_path / "outro_arquivo.txt"
+    for arquivo in (antiga, temporario, recente, outro):
+        arquivo.write_bytes(b"")
+    for arquivo in (antiga, temporario, outro):
+        envelhecer(arquivo, 7200)
+
+    VazaoENA(
+        vazoes, produtibilidade, diretorio_cache=tmp_path, validade_cache=validade
+    ).adicionar_vazoes_artificiais(hidrograma)
+
+    restantes = {arquivo.name for arquivo in arquivos_cache(tmp_path)}
+    assert antiga.name not in restantes
+    assert temporario.name not in restantes
+    assert {recente.name, outro.name} <= restantes
+    assert len(restantes) == 3
+
+
+def test_sem_validade_arquivos_nao_expiram(
+    tmp_path: Path,
+    vazoes: pd.DataFrame,
+    produtibilidade: pd.DataFrame,
+    hidrograma: pd.DataFrame,
+    calculos: list[str],
+) -> None:
+    VazaoENA(
+        vazoes, produtibilidade, diretorio_cache=tmp_path
+    ).adicionar_vazoes_artificiais(hidrograma)
+    (arquivo,) = arquivos_cache(tmp_path)
+    envelhecer(arquivo, 10 * 365 * 86400)
+    calculos.clear()
+
+    VazaoENA(
+        vazoes, produtibilidade, diretorio_cache=tmp_path
+    ).adicionar_vazoes_artificiais(hidrograma)
+
+    assert calculos == []
@@ -0,0 +1,315 @@
+import threading
+
+from collections.abc import Callable
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from ena_ons import VazaoENA
+from ena_ons import regras
+
+
+def calcular_ena_referencia(
+    df: pd.DataFrame, produtibilidade: pd.DataFrame
+) -> pd.DataFrame:
+    df_melt = df.melt(
+        value_name="valor", var_name="codigo", ignore_index=False
+    ).reset_index()
+    df_prod = df_melt.merge(produtibilidade, on="codigo", how="left")
+    df_prod = df_prod.assign(ena=df_prod.valor * df_prod.produtibilidade)
+
+    return df_prod[["data", "codigo", "ena"]].pivot(
+        index="data", columns="codigo", values="ena"
+    )
+
+
+def test_vazoes_artificiais_iguais_as_publicadas(
+    ena: VazaoENA,
+    hidrograma: pd.DataFrame,
+    vazoes_artificiais_esperadas: pd.DataFrame,
+) -> None:
+    vazoes = ena.adicionar_vazoes_artificiais(hidrograma)
+
+    pd.testing.assert_frame_equal(
+        vazoes, vazoes_artificiais_esperadas, rtol=1e-9, check_freq=False
+    )
+
+
+def test_calcular_ena_igual_ao_pivot(
+    ena: VazaoENA,
+    hidrograma: pd.DataFrame,
+    produtibilidade: pd.DataFrame,
+    vazoes_artificiais_esperadas: pd.DataFrame,
+) -> None:
+    vazoes = ena.adicionar_vazoes_artificiais(hidrograma)
+
+    df_ena = ena.calcular_ena(vazoes)
+
+    esperado = calcular_ena_referencia(vazoes_artificiais_esperadas, produtibilidade)
+    pd.testing.assert_frame_equal(df_ena, esperado, rtol=1e-9, check_freq=False)
+    assert df_ena.columns.is_monotonic_increasing
+    assert df_ena.columns.name == "codigo"
+
+
+def test_calcular_ena_reaproveita_produtibilidade_para_outras_colunas(
+    ena: VazaoENA, vazoes: pd.DataFrame, produtibilidade: pd.DataFrame
+) -> None:
+    ena.calcular_ena(vazoes)
+    subconjunto = vazoes[vazoes.columns[::-1][:10]]
+
+    df_ena = ena.calcular_ena(subconjunto)
+
+    esperado = calcular_ena_referencia(subconjunto, produtibilidade)
+    pd.testing.assert_frame_equal(df_ena, esperado, check_freq=False)
+
+
+def agrupar_referencia(df: pd.DataFrame, agrupamento: pd.DataFrame) -> pd.DataFrame:
+    grupo = agrupamento.columns.drop("codigo")[0]
+    df_melt = df.melt(
+        value_name="valor", var_name="codigo", ignore_index=False
+    ).reset_index()
+    df_relacao = df_melt.merge(agrupamento, on="codigo", how="left")
+
+    df_agrupado = df_relacao[["data", grupo, "valor"]]
+    df_agrupado = df_agrupado.groupby(["data", grupo]).sum().reset_index()
+
+    return df_agrupado.pivot(index="data", columns=grupo, values="valor")
+
+
+@pytest.mark.parametrize("grupo", ["posto", "bacia", "subsistema"])
+def test_agrupar_igual_ao_groupby(
+    ena: VazaoENA,
+    hidrograma: pd.DataFrame,
+    agrupamentos: pd.DataFrame,
+    grupo: str,
+) -> None:
+    df_ena = ena.calcular_ena(ena.adicionar_vazoes_artificiais(hidrograma))
+    agrupamento = agrupamentos[["codigo", grupo]]
+
+    df_agrupado = ena.agrupar(df_ena, agrupamento)
+
+    esperado = agrupar_referencia(df_ena, agrupamento)
+    pd.testing.assert_frame_equal(df_agrupado, esperado, rtol=1e-9, check_freq=False)
+
+
+def test_agrupar_ignora_postos_ausentes(ena: VazaoENA, vazoes: pd.DataFrame) -> None:
+    df = vazoes[[1.0, 6.0]]
+    agrupamento = pd.DataFrame(
+        {"codigo": [1, 6, 999], "bacia": ["GRANDE", "GRANDE", "OUTRA"]}
+    )
+
+    df_agrupado = ena.agrupar(df, agrupamento)
+
+    assert list(df_agrupado.columns) == ["GRANDE"]
+    pd.testing.assert_series_equal(
+        df_agrupado["GRANDE"], df[1.0] + df[6.0], check_names=False
+    )
+
+
+def test_float32_mantem_tipo_e_precisao(
+    vazoes: pd.DataFrame,
+    produtibilidade: pd.DataFrame,
+    hidrograma: pd.DataFrame,
+    agrupamentos: pd.DataFrame,
+    vazoes_artificiais_esperadas: pd.DataFrame,
+) -> None:
+    ena = VazaoENA(vazoes, produtibilidade, dtype=np.float32)
+
+    vazoes_artificiais = ena.adicionar_vazoes_artificiais(hidrograma)
+    df_ena = ena.calcular_ena(vazoes_artificiais)
+    df_agrupado = ena.agrupar(df_ena, agrupamentos[["codigo", "bacia"]])
+
+    assert (vazoes_artificiais.dtypes == np.float32).all()
+    assert (df_ena.dtypes == np.float32).all()
+    assert (df_agrupado.dtypes == np.float64).all()
+    pd.testing.assert_frame_equal(
+        vazoes_artificiais,
+        vazoes_artificiais_esperadas.astype(np.float32),
+        rtol=1e-5,
+        check_freq=False,
+    )
+
+
+def test_vazoes_artificiais_memorizadas_por_hidrograma(
+    ena: VazaoENA, hidrograma: pd.DataFrame, calculos: list[str]
+) -> None:
+    primeira = ena.adicionar_vazoes_artificiais(hidrograma)
+    calculos.clear()
+
+    primeira.iloc[:, :] = 0.0
+    segunda = ena.adicionar_vazoes_artificiais(hidrograma.copy())
+
+    assert calculos == []
+    assert not (segunda == 0.0).all().all()
+
+
+def test_memoria_descartada_ao_trocar_dados(
+    ena: VazaoENA, vazoes: pd.DataFrame, hidrograma: pd.DataFrame, calculos: list[str]
+) -> None:
+    ena.adicionar_vazoes_artificiais(hidrograma)
+    ena.dados = vazoes * 2
+    calculos.clear()
+
+    vazoes_artificiais = ena.adicionar_vazoes_artificiais(hidrograma)
+
+    assert calculos
+    pd.testing.assert_series_equal(vazoes_artificiais[1.0], vazoes[1.0] * 2)
+
+
+def test_memoria_guarda_os_quatro_hidrogramas_mais_recentes(
+    ena: VazaoENA, hidrograma: pd.DataFrame, calculos: list[str]
+) -> None:
+    hidrogramas = [hidrograma.assign(vazao=hidrograma.vazao + i) for i in range(5)]
+    for h in hidrogramas[:4]:
+        ena.adicionar_vazoes_artificiais(h)
+    ena.adicionar_vazoes_artificiais(hidrogramas[0])
+    ena.adicionar_vazoes_artificiais(hidrogramas[4])
+    calculos.clear()
+
+    ena.adicionar_vazoes_artificiais(hidrogramas[0])
+    assert calculos == []
+
+    ena.adicionar_vazoes_artificiais(hidrogramas[1])
+    assert calculos
+
+
+def test_vazoes_de_dados_substituidos_durante_o_calculo_nao_memorizadas(
+    ena: VazaoENA,
+    vazoes: pd.DataFrame,
+    hidrograma: pd.DataFrame,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    original = regras.calcular_regra
+    trocas: list[bool] = []
+
+    def trocar_dados(
+        regra: Callable[..., regras.Regra], *args: pd.DataFrame
+    ) -> pd.Series:
+        if not trocas:
+            trocas.append(True)
+            ena.dados = vazoes * 2
+        return original(regra, *args)
+
+    monkeypatch.setattr(regras, "calcular_regra", trocar_dados)
+    antigas = ena.adicionar_vazoes_artificiais(hidrograma)
+    monkeypatch.setattr(regras, "calcular_regra", original)
+
+    novas = ena.adicionar_vazoes_artificiais(hidrograma)
+
+    pd.testing.assert_series_equal(antigas[1.0], vazoes[1.0])
+    pd.testing.assert_series_equal(novas[1.0], vazoes[1.0] * 2)
+
+
+@pytest.mark.parametrize(
+    "datas",
+    [
+        ["2025-01-01", "2025-01-02", "2025-01-03"],
+        ["2025-01-01 00:00:00", "2025-01-02 00:00:00", "2025-01-03 00:00:00"],
+        ["01/01/2025", "01/02/2025", "01/03/2025"],
+    ],
+)
+def test_datas_em_texto_convertidas(
+    produtibilidade: pd.DataFrame, datas: list[str]
+) -> None:
+    dados = pd.DataFrame({1: [1.0, 2.0, 3.0]}, index=pd.Index(datas, name="data"))
+
+    ena = VazaoENA(dados, produtibilidade)
+
+    esperado = pd.DatetimeIndex(["2025-01-01", "2025-01-02", "2025-01-03"], name="data")
+    pd.testing.assert_index_equal(ena.dados.index, esperado, exact=False)
+
+
+@pytest.mark.filterwarnings("ignore:Could not infer format")
+def test_datas_invalidas_rejeitadas(produtibilidade: pd.DataFrame) -> None:
+    dados = pd.DataFrame({1: [1.0, 2.0]}, index=["ontem", "hoje"])
+
+    with pytest.raises(ValueError, match="datetime64"):
+        VazaoENA(dados, produtibilidade)
+
+
+def test_concatenar_partes_de_mesmo_index() -> None:
+    index = pd.date_range("2025-01-01", periods=3, name="data")
+    df = pd.DataFrame({1.0: [1.0, 2.0, 3.0], 2.0: [4.0, 5.0, 6.0]}, index=index)
+    serie = pd.Series([7.0, 8.0, 9.0], index=index, name=3)
+
+    resultado = VazaoENA.__concatenar__([df, serie])
+
+    esperado = pd.concat([df, serie], axis=1)
+    pd.testing.assert_frame_equal(resultado, esperado)
+    assert all(resultado[coluna].to_numpy().flags.c_contiguous for coluna in resultado)
+
+
+def test_concatenar_alinha_partes_de_index_diferentes() -> None:
+    index = pd.date_range("2025-01-01", periods=3, name="data")
+    df = pd.DataFrame({1.0: [1.0, 2.0, 3.0]}, index=index)
+    serie = pd.Series([7.0, 8.0], index=index[1:], name=3)
+
+    resultado = VazaoENA.__concatenar__([df, serie])
+
+    assert list(resultado.columns) == [1.0, 3]
+    pd.testing.assert_series_equal(
+        resultado[3], pd.Series([np.nan, 7.0, 8.0], index=index, name=3)
+    )
+
+
+def test_chamadas_concorrentes_na_mesma_instancia(
+    ena: VazaoENA, hidrograma: pd.DataFrame, vazoes_artificiais_esperadas: pd.DataFrame
+) -> None:
+    hidrogramas = [hidrograma.assign(vazao=hidrograma.vazao + i) for i in range(7)]
+    resultados: list[pd.DataFrame] = []
+    erros: list[BaseException] = []
+
+    def calcular(inicio: int) -> None:
+        try:
+            for i in range(30):
+                h = hidrogramas[(inicio + i) % len(hidrogramas)]
+                vazoes_artificiais = ena.adicionar_vazoes_artificiais(h)
+                if h is hidrogramas[0]:
+                    resultados.append(vazoes_artificiais)
+        except BaseException as erro:
+            erros.append(erro)
+
+    threads = [threading.Thread(target=calcular, args=(i,)) for i in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert erros == []
+    assert resultados
+    for vazoes_artificiais in resultados:
+        pd.testing.assert_frame_equal(
+            vazoes_artificiais,
+            vazoes_artificiais_esperadas,
+            rtol=1e-9,
+            check_freq=False,
+        )
+
+
+def test_calcular_ena_concorrente_com_colunas_diferentes(
+    ena: VazaoENA, vazoes: pd.DataFrame, produtibilidade: pd.DataFrame
+) -> None:
+    frames = [vazoes, vazoes[vazoes.columns[::-1][:10]], vazoes[vazoes.columns[5:]]]
+    esperados = [calcular_ena_referencia(df, produtibilidade) for df in frames]
+    divergencias: list[int] = []
+    erros: list[BaseException] = []
+
+    def calcular(inicio: int) -> None:
+        try:
+            for i in range(300):
+                posicao = (inicio + i) % len(frames)
+                df_ena = ena.calcular_ena(frames[posicao])
+                if not df_ena.equals(esperados[posicao]):
+                    divergencias.append(posicao)
+        except BaseException as erro:
+            erros.append(erro)
+
+    threads = [threading.Thread(target=calcular, args=(i,)) for i in range(6)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert erros == []
+    assert divergencias == []
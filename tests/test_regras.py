@@ -0,0 +1,195 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from ena_ons import regras
+from ena_ons.codigos import codigos
+
+
+class Contadora:
+    instancias = 0
+
+    def __init__(self, df: pd.DataFrame) -> None:
+        Contadora.instancias += 1
+        self.billings = df[codigos.billings]
+
+    def calcular(self) -> pd.Series:
+        return self.billings.rename(codigos.pedreira)
+
+
+def test_regra_calculada_uma_vez_dentro_do_contexto(vazoes: pd.DataFrame) -> None:
+    Contadora.instancias = 0
+
+    with regras.memorizar_intermediarios(vazoes):
+        primeira = regras.calcular_regra(Contadora, vazoes)
+        segunda = regras.calcular_regra(Contadora, vazoes)
+
+    assert primeira is segunda
+    assert Contadora.instancias == 1
+
+
+def test_regra_recalculada_fora_do_contexto(vazoes: pd.DataFrame) -> None:
+    Contadora.instancias = 0
+
+    with regras.memorizar_intermediarios(vazoes):
+        regras.calcular_regra(Contadora, vazoes)
+    regras.calcular_regra(Contadora, vazoes)
+    regras.calcular_regra(Contadora, vazoes)
+
+    assert Contadora.instancias == 3
+
+
+def test_contextos_aninhados_mantem_memoria_ate_o_ultimo(
+    vazoes: pd.DataFrame,
+) -> None:
+    Contadora.instancias = 0
+
+    with regras.memorizar_intermediarios(vazoes):
+        with regras.memorizar_intermediarios(vazoes):
+            regras.calcular_regra(Contadora, vazoes)
+        regras.calcular_regra(Contadora, vazoes)
+
+    assert Contadora.instancias == 1
+
+
+def test_memoria_separada_por_dataframe(vazoes: pd.DataFrame) -> None:
+    Contadora.instancias = 0
+    outras = vazoes * 2
+
+    with regras.memorizar_intermediarios(vazoes):
+        with regras.memorizar_intermediarios(outras):
+            original = regras.calcular_regra(Contadora, vazoes)
+            dobrada = regras.calcular_regra(Contadora, outras)
+
+    assert Contadora.instancias == 2
+    pd.testing.assert_series_equal(dobrada, original * 2)
+
+
+def test_belo_monte_memorizado_por_hidrograma(
+    vazoes: pd.DataFrame, hidrograma: pd.DataFrame
+) -> None:
+    outro = hidrograma.assign(vazao=hidrograma.vazao + 1000)
+
+    with regras.memorizar_intermediarios(vazoes):
+        belo_monte = regras.calcular_regra(
+            regras.BeloMonteArtificial, vazoes, hidrograma
+        )
+        outro_belo_monte = regras.calcular_regra(
+            regras.BeloMonteArtificial, vazoes, outro
+        )
+        pimental = regras.calcular_regra(regras.PimentalArtificial, vazoes, hidrograma)
+
+    assert not belo_monte.equals(outro_belo_monte)
+    pd.testing.assert_series_equal(
+        pimental,
+        (vazoes[codigos.pimental] - belo_monte).rename(codigos.pimental_artificial),
+    )
+
+
+@pytest.mark.parametrize(
+    ("vazao", "esperado"),
+    [(95.0, 59.5), (190.0, 119.0), (200.0, 119.0), (240.0, 150.0), (300.0, 160.0)],
+)
+def test_bombear_valor_escalar(
+    vazoes: pd.DataFrame, vazao: float, esperado: float
+) -> None:
+    bombeamento = regras.BombeamentoSantaCecilia(vazoes)
+
+    assert bombeamento.bombear(vazao) == pytest.approx(esperado)
+
+
+def test_helpers_escalares_iguais_a_regra_vetorizada(
+    vazoes: pd.DataFrame, hidrograma: pd.DataFrame
+) -> None:
+    tocos = regras.VertimentoTocos(vazoes)
+    jordao = regras.JordaoArtificial(vazoes)
+    segredo = regras.SegredoArtificial(vazoes)
+    belo_monte = regras.BeloMonteArtificial(vazoes, hidrograma)
+    vazao_tocos = vazoes[codigos.tocos]
+
+    resultados = [
+        (
+            tocos.calcular(),
+            [tocos.verter(v) for v in vazao_tocos],
+        ),
+        (
+            jordao.calcular(),
+            [jordao.desviar(v) for v in vazoes[codigos.jordao]],
+        ),
+        (
+            segredo.calcular(),
+            [
+                segredo.desviar(j, s)
+                for j, s in zip(vazoes[codigos.jordao], vazoes[codigos.segredo])
+            ],
+        ),
+        (
+            belo_monte.calcular(),
+            [
+                belo_monte.desviar(p, h)
+                for p, h in belo_monte.preparar().itertuples(index=False)
+            ],
+        ),
+    ]
+
+    for vetorizado, escalar in resultados:
+        assert all(isinstance(valor, float) for valor in escalar)
+        np.testing.assert_allclose(vetorizado.to_numpy(), escalar)
+    assert tocos.verter(np.nan) == 0.0
+
+
+def test_entradas_das_regras_expostas_como_series(vazoes: pd.DataFrame) -> None:
+    santana = regras.SantanaArtificial(vazoes)
+
+    assert isinstance(santana.tocos, pd.Series)
+    assert isinstance(santana.vertimento_tocos, pd.Series)
+    pd.testing.assert_series_equal(santana.tocos, vazoes[codigos.tocos])
+    assert santana.santana.name == codigos.santana
+
+
+@pytest.mark.parametrize(
+    ("regra", "naturais"),
+    [
+        (regras.BarraBonitaArtificial, {"barra_bonita": codigos.barra_bonita}),
+        (
+            regras.IlhaSolteiraEquivalente,
+            {
+                "tres_irmaos": codigos.tres_irmaos,
+                "ilha_solteira": codigos.ilha_solteira,
+            },
+        ),
+    ],
+)
+def test_regras_do_tiete_mantem_atributos_por_usina(
+    vazoes: pd.DataFrame, regra: type, naturais: dict[str, int]
+) -> None:
+    instancia = regra(vazoes)
+
+    for atributo, posto in naturais.items():
+        pd.testing.assert_series_equal(getattr(instancia, atributo), vazoes[posto])
+    for atributo, posto in {
+        "esouza": codigos.edgard_souza_com_tributarios,
+        "guarapiranga": codigos.guarapiranga,
+        "billings": codigos.billings,
+    }.items():
+        pd.testing.assert_series_equal(getattr(instancia, atributo), vazoes[posto])
+
+    natural = sum(vazoes[posto] for posto in naturais.values())
+    billings_artificial = regras.BillingsArtificial(vazoes).calcular()
+    pd.testing.assert_series_equal(
+        instancia.calcular(),
+        (natural - billings_artificial).rename(instancia.codigo),
+    )
+
+
+def test_belo_monte_aceita_mes_nao_inteiro(
+    vazoes: pd.DataFrame, hidrograma: pd.DataFrame
+) -> None:
+    hidrograma_float = hidrograma.astype({"mes": float})
+
+    belo_monte = regras.BeloMonteArtificial(vazoes, hidrograma_float)
+
+    pd.testing.assert_series_equal(
+        belo_monte.calcular(),
+        regras.BeloMonteArtificial(vazoes, hidrograma).calcular(),
+    )